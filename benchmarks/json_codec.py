@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Compare the JSON codecs on large zone payloads.
+
+Decodes a synthetic `get_domain` response (and encodes record bodies) with
+every installed codec, e.g.:
+
+    ./benchmarks/json_codec.py --records 100000
+"""
+
+import argparse
+import time
+
+from octodns_bunny.codec import CODECS, JSONCodec
+
+
+def zone_payload(records):
+    """A synthetic GET /dnszone/{id} response body with `records` records."""
+    return {
+        "Id": 1,
+        "Domain": "example.com",
+        "Records": [
+            {
+                "Id": i,
+                "Type": 0,
+                "Ttl": 300,
+                "Value": f"192.0.{i // 256 % 256}.{i % 256}",
+                "Name": f"host{i}",
+                "Weight": 0,
+                "Priority": 0,
+                "Port": 0,
+                "Flags": 0,
+                "Tag": "",
+                "Accelerated": False,
+                "AcceleratedPullZoneId": 0,
+                "LinkName": "",
+                "IPGeoLocationInfo": None,
+                "GeolocationInfo": None,
+                "MonitorStatus": 0,
+                "MonitorType": 0,
+                "GeolocationLatitude": 0.0,
+                "GeolocationLongitude": 0.0,
+                "EnviromentalVariables": [],
+                "LatencyZone": None,
+                "SmartRoutingType": 0,
+                "Disabled": False,
+                "Comment": None,
+            }
+            for i in range(records)
+        ],
+    }
+
+
+def timed(func, rounds):
+    """Best wall time of `rounds` calls of func."""
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--records', type=int, default=100000)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    payload = zone_payload(args.records)
+    content = JSONCodec().dumps(payload)
+    print(f'payload: {args.records} records, {len(content) / 2**20:.1f} MiB')
+    for name, codec_class in sorted(CODECS.items()):
+        try:
+            codec = codec_class()
+        except ImportError:
+            print(f'{name:>8}: not installed')
+            continue
+        decode = timed(lambda: codec.loads(content), args.rounds)
+        encode = timed(
+            lambda: [codec.dumps(r) for r in payload["Records"]], args.rounds
+        )
+        print(
+            f'{name:>8}: decode {decode * 1000:.1f} ms, '
+            f'encode (per record) {encode * 1000:.1f} ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
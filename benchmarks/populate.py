@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Compare the cost of a target populate with and without trusted_populate.
+
+Populates a synthetic zone from already downloaded records, so only the
+record conversion and building is measured, e.g.:
+
+    ./benchmarks/populate.py --records 50000
+"""
+
+import argparse
+import time
+
+from octodns.zone import Zone
+
+from octodns_bunny.provider import BunnyDNSProvider
+
+ZONE_NAME = 'example.com.'
+
+
+def zone_records(records):
+    """`records` synthetic records, as returned by lookup_domain_records."""
+    result = []
+    for i in range(records):
+        record = {
+            "Id": i,
+            "Ttl": 300,
+            "Name": f"host{i}",
+            "Weight": 0,
+            "Priority": 0,
+            "Port": 0,
+            "Flags": 0,
+            "Tag": "",
+            "Accelerated": False,
+            "LinkName": "",
+            "MonitorType": 0,
+            "GeolocationLatitude": 0.0,
+            "GeolocationLongitude": 0.0,
+            "LatencyZone": None,
+            "SmartRoutingType": 0,
+            "Disabled": False,
+        }
+        kind = i % 4
+        if kind == 0:
+            record.update(Type="A", Value=f"192.0.{i // 256 % 256}.{i % 256}")
+        elif kind == 1:
+            record.update(Type="TXT", Value=f"v=spf1 include:{i}.example.net")
+        elif kind == 2:
+            record.update(Type="MX", Value=f"mx{i}.example.net", Priority=10)
+        else:
+            record.update(Type="CNAME", Value=f"target{i}.example.net")
+        result.append(record)
+    return result
+
+
+def timed(provider, records, rounds):
+    """Best wall time of `rounds` target populates of the records."""
+    best = None
+    for _ in range(rounds):
+        provider._zone_records[ZONE_NAME] = records
+        zone = Zone(ZONE_NAME, [])
+        start = time.perf_counter()
+        provider.populate(zone, target=True)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    records = zone_records(args.records)
+    print(f'zone: {args.records} records')
+    for trusted in (False, True):
+        provider = BunnyDNSProvider(
+            'bench', 'token', share_client=False, trusted_populate=trusted
+        )
+        elapsed = timed(provider, records, args.rounds)
+        print(
+            f'trusted_populate={trusted!s:>5}: {elapsed * 1000:.1f} ms, '
+            f'{elapsed / args.records * 1e6:.1f} us per record'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+"""
+Replay recorded BunnyDNS API sessions to catch performance regressions.
+
+Record a session against the real API once (the desired zone is applied,
+use a scratch zone), e.g.:
+
+    ./benchmarks/replay.py record --token $BUNNY_TOKEN --zone example.com \\
+        --recording example.jsonl --desired-dir zones/
+
+and replay it offline, comparing against a baseline saved by an earlier
+replay (`--save-baseline`):
+
+    ./benchmarks/replay.py replay --zone example.com \\
+        --recording example.jsonl --desired-dir zones/ \\
+        --baseline example.baseline.json --latency-scale 1
+
+The replay exits with status 1 when the request count grew or the wall time
+grew by more than `--tolerance`.
+"""
+
+# pylint: disable=protected-access
+import argparse
+import json
+import sys
+import time
+
+from octodns.provider.yaml import YamlProvider
+from octodns.zone import Zone
+
+from octodns_bunny.provider import BunnyDNSProvider
+
+
+def run(provider, zone_name, desired_dir):
+    """
+    Populate the zone and, with a desired zone, plan and apply it.
+
+    :return: a tuple of (wall time, API request count)
+    """
+    start = time.perf_counter()
+    provider.populate(Zone(zone_name, []), target=True)
+    if desired_dir:
+        desired = Zone(zone_name, [])
+        YamlProvider('desired', desired_dir).populate(desired)
+        plan = provider.plan(desired)
+        if plan is not None:
+            provider.apply(plan)
+    elapsed = time.perf_counter() - start
+    return elapsed, provider._client.stats().get('requests', 0)
+
+
+def check(result, baseline, tolerance):
+    """Compare a replay result with the baseline, return the regressions."""
+    regressions = []
+    if result['requests'] > baseline['requests']:
+        regressions.append(
+            f"requests: {result['requests']} > {baseline['requests']}"
+        )
+    limit = baseline['wall_time'] * (1 + tolerance)
+    if result['wall_time'] > limit:
+        regressions.append(
+            f"wall time: {result['wall_time']:.3f}s > {limit:.3f}s "
+            f"(baseline {baseline['wall_time']:.3f}s)"
+        )
+    return regressions
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('mode', choices=('record', 'replay'))
+    parser.add_argument('--zone', required=True)
+    parser.add_argument('--recording', required=True)
+    parser.add_argument('--desired-dir')
+    parser.add_argument('--token', default='replay')
+    parser.add_argument('--api-url', default='https://api.bunny.net')
+    parser.add_argument('--latency-scale', type=float, default=0.0)
+    parser.add_argument('--baseline')
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args()
+
+    zone_name = f"{args.zone.rstrip('.')}."
+    if args.mode == 'record':
+        provider = BunnyDNSProvider(
+            'record',
+            args.token,
+            api_url=args.api_url,
+            share_client=False,
+            record_file=args.recording,
+        )
+    else:
+        provider = BunnyDNSProvider(
+            'replay',
+            args.token,
+            share_client=False,
+            replay_file=args.recording,
+            replay_latency=args.latency_scale,
+        )
+    elapsed, requests = run(provider, zone_name, args.desired_dir)
+    result = {'requests': requests, 'wall_time': elapsed}
+    print(f'{args.mode}: {requests} requests in {elapsed:.3f}s')
+
+    if args.mode == 'record' or not args.baseline:
+        return
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as fh:
+            json.dump(result, fh, indent=2)
+        print(f'baseline saved to {args.baseline}')
+        return
+    with open(args.baseline, encoding='utf-8') as fh:
+        baseline = json.load(fh)
+    regressions = check(result, baseline, args.tolerance)
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
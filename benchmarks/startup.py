@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Measure the provider import and startup cost.
+
+Every measurement runs in a fresh interpreter, e.g.:
+
+    ./benchmarks/startup.py --rounds 10
+"""
+
+import argparse
+import subprocess
+import sys
+
+STAGES = {
+    'import octodns_bunny': 'import octodns_bunny',
+    'import provider': 'import octodns_bunny.provider',
+    'construct provider': '''
+import octodns_bunny.provider
+start = time.perf_counter()
+octodns_bunny.provider.BunnyDNSProvider('bench', 'token')
+''',
+}
+
+TEMPLATE = '''
+import sys
+import time
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start, 'requests' in sys.modules)
+'''
+
+
+def measure(code):
+    """Run code in a fresh interpreter, return (seconds, requests imported)."""
+    output = subprocess.check_output(
+        [sys.executable, '-c', TEMPLATE.format(code=code)], text=True
+    )
+    elapsed, requests_imported = output.split()
+    return float(elapsed), requests_imported == 'True'
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    for stage, code in STAGES.items():
+        results = [measure(code) for _ in range(args.rounds)]
+        best = min(elapsed for elapsed, _ in results)
+        print(
+            f'{stage:>20}: {best * 1000:.1f} ms '
+            f'(requests imported: {results[0][1]})'
+        )
+
+
+if __name__ == '__main__':
+    main()
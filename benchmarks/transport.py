@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""
+Compare the BunnyDNS client transports.
+
+Fires concurrent zone reads through each transport and reports the wall
+time. Point it to a local h2-capable stand-in of the Bunny API, e.g.:
+
+    ./benchmarks/transport.py --api-url https://localhost:8443 --zone example.com
+"""
+
+# pylint: disable=protected-access
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from octodns_bunny.client import BunnyDNSClient
+from octodns_bunny.transport import TRANSPORTS
+
+
+def run(transport, args):
+    """Run the benchmark for a single transport, return the wall time."""
+    client = BunnyDNSClient(
+        token=args.token,
+        api_url=args.api_url,
+        min_concurrency=args.workers,
+        max_concurrency=args.workers,
+        transport=transport,
+    )
+    # Resolve the zone ID up front, it's not what we measure
+    zone_id = client._map_domain_name_to_id(args.zone)
+
+    def get_domain(_):
+        return client._request(
+            method="GET",
+            path=f"/dnszone/{zone_id}",
+            headers=None,
+            data=None,
+            exception_messages={},
+            valid_status_codes=[200],
+            # A unique parameter per call, to get past the single-flight layer
+            params={"_": _},
+        )
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        list(executor.map(get_domain, range(args.requests)))
+    return time.perf_counter() - start
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--api-url', required=True)
+    parser.add_argument('--token', default='benchmark')
+    parser.add_argument('--zone', required=True)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--workers', type=int, default=32)
+    parser.add_argument(
+        '--transport', action='append', choices=sorted(TRANSPORTS.keys())
+    )
+    args = parser.parse_args()
+
+    for transport in args.transport or sorted(TRANSPORTS.keys()):
+        elapsed = run(transport, args)
+        print(
+            f'{transport:>10}: {args.requests} requests in {elapsed:.3f}s '
+            f'({args.requests / elapsed:.1f} req/s)'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,7 @@
 """Init the BunnyDNSProvider"""
 
 # pylint: disable=pointless-statement
-from .provider import BunnyDNSProvider, BunnyDNSProviderException
+# pylint: disable=import-outside-toplevel
 from .record import (
     BunnyDNSPullZoneRecord,
     BunnyDNSRedirectRecord,
@@ -14,5 +14,13 @@ __version__ = '0.0.2'
 BunnyDNSPullZoneRecord
 BunnyDNSScriptRecord
 BunnyDNSRedirectRecord
-BunnyDNSProvider
-BunnyDNSProviderException
+
+
+def __getattr__(name):
+    # The provider (and the client stack behind it) is imported on first
+    # access, the custom record types above are registered right away
+    if name in ('BunnyDNSProvider', 'BunnyDNSProviderException'):
+        from . import provider
+
+        return getattr(provider, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,111 @@
+"""Circuit breaker for the BunnyDNS client."""
+
+import threading
+import time
+from collections import deque
+
+from .client_exceptions import BunnyDNSClientAPIExceptionCircuitOpen
+
+CIRCUIT_CLOSED = 'closed'
+CIRCUIT_OPEN = 'open'
+CIRCUIT_HALF_OPEN = 'half-open'
+
+
+class CircuitBreaker:
+    """
+    Fail fast while the API is unhealthy.
+
+    The circuit opens after `failure_threshold` consecutive failures, or
+    when at least `error_rate` of the last `window` calls failed. While it
+    is open, calls are rejected right away with
+    BunnyDNSClientAPIExceptionCircuitOpen. After `reset_timeout` seconds a
+    single probe call is let through (half-open): its success closes the
+    circuit, its failure opens it again. Calls that went out before the
+    circuit opened and finish meanwhile don't count as the probe's outcome.
+    """
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def __init__(
+        self, failure_threshold=5, error_rate=0.5, window=20, reset_timeout=30
+    ):
+        self.failure_threshold = failure_threshold
+        self.error_rate = error_rate
+        self.reset_timeout = reset_timeout
+        self._outcomes = deque(maxlen=window)
+        self._consecutive_failures = 0
+        self._state = CIRCUIT_CLOSED
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """The current state of the circuit."""
+        return self._state
+
+    def before_call(self):
+        """
+        Raise if the call must not go out.
+
+        :return: True if the call is the probe of a half-open circuit, to be
+                 passed on to `record`
+        """
+        with self._lock:
+            if self._state == CIRCUIT_CLOSED:
+                return False
+            if (
+                self._state == CIRCUIT_OPEN
+                and time.monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                self._state = CIRCUIT_HALF_OPEN
+            if self._state == CIRCUIT_HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            retry_in = max(
+                0, self.reset_timeout - (time.monotonic() - self._opened_at)
+            )
+        raise BunnyDNSClientAPIExceptionCircuitOpen(
+            error_message=f"BunnyDNS API circuit is open, retry in {retry_in:.0f}s"
+        )
+
+    def record(self, failed, probe=False):
+        """
+        Record the outcome of a call.
+
+        `failed` is None for calls that say nothing about the API health,
+        `probe` is what `before_call` returned for the call.
+        """
+        with self._lock:
+            if probe:
+                self._probing = False
+            if failed is None:
+                return
+            if probe:
+                if failed:
+                    self._open()
+                else:
+                    self._close()
+                return
+            self._outcomes.append(failed)
+            if not failed:
+                self._consecutive_failures = 0
+                return
+            self._consecutive_failures += 1
+            if self._state != CIRCUIT_CLOSED:
+                return
+            if self._consecutive_failures >= self.failure_threshold or (
+                len(self._outcomes) == self._outcomes.maxlen
+                and sum(self._outcomes) / len(self._outcomes) >= self.error_rate
+            ):
+                self._open()
+
+    def _open(self):
+        self._state = CIRCUIT_OPEN
+        self._opened_at = time.monotonic()
+
+    def _close(self):
+        self._state = CIRCUIT_CLOSED
+        self._opened_at = None
+        self._consecutive_failures = 0
+        self._outcomes.clear()
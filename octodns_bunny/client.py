@@ -1,31 +1,182 @@
 """A client to access BunnyDNS API."""
 
-from requests import Request, Session
+import inspect
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from functools import partial
 
+from .circuit_breaker import CircuitBreaker
 from .client_exceptions import (
     BunnyDNSClientAPIException400,
     BunnyDNSClientAPIException401,
     BunnyDNSClientAPIException404,
+    BunnyDNSClientAPIException429,
     BunnyDNSClientAPIException500,
+    BunnyDNSClientAPIExceptionCircuitOpen,
+    BunnyDNSClientAPIExceptionDeadline,
     BunnyDNSClientAPIExceptionDomainNotFound,
+    BunnyDNSClientAPIExceptionServerError,
+    BunnyDNSClientAPIExceptionTimeout,
+    BunnyDNSClientAPIExceptionUnexpectedStatus,
 )
+from .codec import CODEC_AUTO, build_codec
+from .concurrency import AdaptiveLimiter, SingleFlight
+from .transport import TRANSPORT_REQUESTS, build_transport
+
+log = logging.getLogger("BunnyDNSClient")
+
+DEFAULT_API_URL = "https://api.bunny.net"
+# Higher timeout is necessary, because some operations (like creating the
+# DNS accelerated records) take a really long time to process by the BunnyDNS API.
+DEFAULT_TIMEOUT = 30
+
+# Shared clients are only shared when these options (which pick the
+# transport) match too, e.g. a replaying provider never gets the live client
+SHARED_CLIENT_KEY_OPTIONS = (
+    "transport",
+    "record_file",
+    "replay_file",
+    "replay_latency",
+)
+# Process-wide registry of clients, see BunnyDNSClient.shared()
+_SHARED_CLIENTS = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+_RECORD_PATH = re.compile(r"/records/\d+$")
+
+
+def request_kind(method, path, data=None):
+    """
+    The kind of an API request, requests of a kind have comparable latencies.
+
+    The lookups of every zone are their own kind (their latency grows with
+    the zone size), the record mutations of every zone too, and accelerated
+    record mutations (much slower to process) are apart.
+    """
+    kind = f"{method} {_RECORD_PATH.sub(r'/records/*', path)}"
+    if isinstance(data, dict) and data.get("Accelerated"):
+        kind += " accelerated"
+    return kind
 
 
 class BunnyDNSClient:
     """Main client class."""
 
-    def __init__(self, token):
+    def __init__(
+        self,
+        token,
+        api_url=DEFAULT_API_URL,
+        min_concurrency=1,
+        max_concurrency=16,
+        circuit_failure_threshold=5,
+        circuit_error_rate=0.5,
+        circuit_window=20,
+        circuit_reset_timeout=30,
+        transport=TRANSPORT_REQUESTS,
+        json_codec=CODEC_AUTO,
+        record_file=None,
+        replay_file=None,
+        replay_latency=0.0,
+    ):
         # Set API URL
-        self._api_url = "https://api.bunny.net"
-        # Init Requests session
-        self._api_session = Session()
-        self._api_session.headers.update(
+        self._api_url = api_url
+        # Init the HTTP transport (a Requests session by default), the
+        # exchanges can be recorded to a file or replayed from one
+        self._transport = build_transport(
+            transport,
             {
                 "AccessKey": f"{token}",
                 "User-Agent": "octodns-bunny",
                 "Accept": "application/json",
-            }
+            },
+            record_file=record_file,
+            replay_file=replay_file,
+            replay_latency=replay_latency,
+        )
+        # Request and response bodies are (de)serialized by the codec
+        self._codec = build_codec(json_codec)
+        # Concurrent identical GETs are collapsed into a single API call
+        self._single_flight = SingleFlight()
+        self._stats = Counter()
+        self._stats_lock = threading.Lock()
+        # In-flight request limit, adapted to how the API keeps up
+        self._limiter = AdaptiveLimiter(
+            floor=min_concurrency, ceiling=max_concurrency
         )
+        # Fail fast while the API is down
+        self._breaker = CircuitBreaker(
+            failure_threshold=circuit_failure_threshold,
+            error_rate=circuit_error_rate,
+            window=circuit_window,
+            reset_timeout=circuit_reset_timeout,
+        )
+        # Zone name -> zone ID index, refreshed by every list_zones() call
+        self._zone_ids = {}
+        # Zone name -> DateModified of the last records lookup
+        self._zone_modified = {}
+
+    @classmethod
+    def shared(cls, token, api_url=DEFAULT_API_URL, **kwargs):
+        """
+        Return the process-wide client for the token and API URL.
+
+        Provider instances using the same account (and transport, see
+        SHARED_CLIENT_KEY_OPTIONS) share a single client, and thus its
+        session (connection pool), zone ID index and concurrency limiter.
+        The remaining arguments only apply to the instance that creates the
+        client, a warning is logged when a later one asks for others.
+        """
+        options = inspect.signature(cls).bind(token, api_url, **kwargs)
+        options.apply_defaults()
+        options = options.arguments
+        key = (token, api_url) + tuple(
+            options[name] for name in SHARED_CLIENT_KEY_OPTIONS
+        )
+        with _SHARED_CLIENTS_LOCK:
+            client = _SHARED_CLIENTS.get(key)
+            if client is None:
+                client = cls(**options)
+                client._shared_options = options
+                _SHARED_CLIENTS[key] = client
+                return client
+        ignored = sorted(
+            name
+            for name, value in options.items()
+            if name != "token" and client._shared_options[name] != value
+        )
+        if ignored:
+            log.warning(
+                "shared: the shared client for %s was created with other "
+                "options, ignoring %s",
+                api_url,
+                ", ".join(
+                    f"{name}={options[name]!r} "
+                    f"(using {client._shared_options[name]!r})"
+                    for name in ignored
+                ),
+            )
+        return client
+
+    def _count(self, name, value=1):
+        """Increment a client statistics counter."""
+        with self._stats_lock:
+            self._stats[name] += value
+
+    def stats(self):
+        """Return a snapshot of the client statistics."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["concurrency_limit"] = self._limiter.limit
+        stats["circuit_state"] = self._breaker.state
+        return stats
+
+    @property
+    def latency(self):
+        """The smoothed latency of healthy requests (None before any)."""
+        return self._limiter.latency
 
     # pylint: disable=too-many-arguments
     # pylint: disable=too-many-positional-arguments
@@ -38,20 +189,95 @@ class BunnyDNSClient:
         exception_messages,
         valid_status_codes,
         params,
+        timeout=DEFAULT_TIMEOUT,
+        deadline=None,
+    ):
+        """
+        Fire a BunnyDNS API request (concurrent identical GETs are shared).
+
+        With a `deadline` (a `time.monotonic()` timestamp), the timeout is
+        clamped to the time left, and no request is sent once it's passed.
+        """
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise BunnyDNSClientAPIExceptionDeadline(
+                    error_message=f"{method} {path} not sent, deadline passed"
+                )
+            timeout = min(timeout, remaining)
+        send = partial(
+            self._send,
+            method,
+            path,
+            headers,
+            data,
+            exception_messages,
+            valid_status_codes,
+            params,
+            timeout,
+        )
+        if method == "GET" and data is None:
+            key = (
+                path,
+                tuple(sorted(params.items())) if params else None,
+                tuple(sorted(headers.items())) if headers else None,
+            )
+            result, shared = self._single_flight.do(key, send)
+            if shared:
+                self._count("singleflight_hits")
+            return result
+        return send()
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def _send(
+        self,
+        method,
+        path,
+        headers,
+        data,
+        exception_messages,
+        valid_status_codes,
+        params,
+        timeout,
     ):
-        """Fire a BunnyDNS API request."""
-        prepared_api_call = self._api_session.prepare_request(
-            Request(
+        """Send a single BunnyDNS API request and map the response."""
+        body = None
+        if data is not None:
+            body = self._codec.dumps(data)
+            headers = dict(headers or {})
+            if not any(k.lower() == "content-type" for k in headers):
+                headers["Content-Type"] = "application/json"
+        try:
+            probe = self._breaker.before_call()
+        except BunnyDNSClientAPIExceptionCircuitOpen:
+            self._count("circuit_rejections")
+            raise
+        self._count("requests")
+        self._count(f"requests_{method}")
+        slot = self._limiter.acquire(request_kind(method, path, data))
+        failed = True
+        try:
+            api_call = self._transport.send(
                 method,
                 self._api_url + path,
-                json=data,
                 headers=headers,
+                body=body,
                 params=params,
+                timeout=timeout,
             )
-        )
-        # Higher timeout is necessary, because some operations (like creating the
-        # DNS accelerated records) take a really long time to process by the BunnyDNS API.
-        api_call = self._api_session.send(prepared_api_call, timeout=30)
+            failed = api_call.status_code == 429 or api_call.status_code >= 500
+        except self._transport.timeout_error as exc:
+            if timeout < DEFAULT_TIMEOUT:
+                # The caller chose to not wait for the API, that's not an
+                # API health issue
+                failed = None
+            raise BunnyDNSClientAPIExceptionTimeout(
+                error_message=f"{method} {path} timed out after {timeout}s"
+            ) from exc
+        finally:
+            self._limiter.release(slot, overloaded=failed)
+            self._breaker.record(failed, probe=probe)
         if api_call.status_code in exception_messages.keys():
             # error_message = exception_messages[api_call.status_code]
             error_message = f"{exception_messages[api_call.status_code]} Data: {api_call.text}"
@@ -61,19 +287,36 @@ class BunnyDNSClient:
             # Bunny API returns HTTP 204 No Content for deletions
             if api_call.status_code == 204:
                 return {}
-            return api_call.json()
+            return self._codec.loads(api_call.content)
         if api_call.status_code == 400:
             raise BunnyDNSClientAPIException400(error_message=error_message)
         if api_call.status_code == 401:
             raise BunnyDNSClientAPIException401(error_message=error_message)
         if api_call.status_code == 404:
             raise BunnyDNSClientAPIException404(error_message=error_message)
+        if api_call.status_code == 429:
+            raise BunnyDNSClientAPIException429(
+                error_message=f"{method} {path} rate limited: {api_call.text}"
+            )
         if api_call.status_code == 500:
             raise BunnyDNSClientAPIException500(error_message=api_call.text)
+        if api_call.status_code > 500:
+            raise BunnyDNSClientAPIExceptionServerError(
+                error_message=f"{method} {path} failed with HTTP "
+                f"{api_call.status_code}: {api_call.text}"
+            )
+        if not 200 <= api_call.status_code < 300:
+            # Never hand an error body back as data
+            raise BunnyDNSClientAPIExceptionUnexpectedStatus(
+                error_message=f"{method} {path} failed with HTTP "
+                f"{api_call.status_code}: {api_call.text}"
+            )
 
-        return api_call.json()
+        if not api_call.content:
+            return {}
+        return self._codec.loads(api_call.content)
 
-    def list_zones(self):
+    def list_zones(self, deadline=None):
         """List zones."""
         zones = []
         exception_messages = {
@@ -91,13 +334,15 @@ class BunnyDNSClient:
                 exception_messages=exception_messages,
                 valid_status_codes=[200],
                 params={"page": page, "per_page": 1000},
+                deadline=deadline,
             )
             zones.extend(zone_api_call["Items"])
             page += 1
 
+        self._zone_ids = {zone["Domain"]: zone["Id"] for zone in zones}
         return zones
 
-    def add_zone(self, domain):
+    def add_zone(self, domain, deadline=None):
         """Add a zone."""
         exception_messages = {
             400: "Failed adding the DNS Zone. Model validation failed",
@@ -112,10 +357,13 @@ class BunnyDNSClient:
             exception_messages=exception_messages,
             valid_status_codes=[201],
             params=None,
+            deadline=deadline,
         )
         return add_zone_api_call
 
-    def add_record(self, domain, params):
+    def add_record(
+        self, domain, params, timeout=DEFAULT_TIMEOUT, deadline=None
+    ):
         """Add a record."""
         exception_messages = {
             400: "Failed adding the DNS record. Model validation failed.",
@@ -126,7 +374,7 @@ class BunnyDNSClient:
 
         # Get Domain ID from list
         try:
-            domain_id = self._map_domain_name_to_id(domain)
+            domain_id = self._map_domain_name_to_id(domain, deadline=deadline)
         except BunnyDNSClientAPIException404 as exc:
             raise BunnyDNSClientAPIExceptionDomainNotFound from exc
         # Map Record Type to integer
@@ -139,10 +387,12 @@ class BunnyDNSClient:
             exception_messages=exception_messages,
             valid_status_codes=[201],
             params=None,
+            timeout=timeout,
+            deadline=deadline,
         )
         return add_record_api_call
 
-    def delete_record(self, domain, record_id):
+    def delete_record(self, domain, record_id, deadline=None):
         """Delete an existing record."""
         exception_messages = {
             400: "Failed deleting the DNS Record. See error response.",
@@ -152,7 +402,7 @@ class BunnyDNSClient:
         }
 
         # Get Domain ID from list
-        domain_id = self._map_domain_name_to_id(domain)
+        domain_id = self._map_domain_name_to_id(domain, deadline=deadline)
         delete_record_api_call = self._request(
             method="DELETE",
             path=f"/dnszone/{domain_id}/records/{record_id}",
@@ -161,10 +411,11 @@ class BunnyDNSClient:
             params=None,
             data=None,
             headers=None,
+            deadline=deadline,
         )
         return delete_record_api_call
 
-    def get_domain(self, domain):
+    def get_domain(self, domain, deadline=None):
         """Get details about a domain."""
         exception_messages = {
             401: "The request authorization failed",
@@ -173,7 +424,7 @@ class BunnyDNSClient:
         }
         # Get Domain ID from list
         try:
-            domain_id = self._map_domain_name_to_id(domain)
+            domain_id = self._map_domain_name_to_id(domain, deadline=deadline)
         except BunnyDNSClientAPIException404 as exc:
             raise BunnyDNSClientAPIExceptionDomainNotFound from exc
         get_domain_record_api_call = self._request(
@@ -184,18 +435,22 @@ class BunnyDNSClient:
             params=None,
             data=None,
             headers=None,
+            deadline=deadline,
         )
         return get_domain_record_api_call
 
-    def _map_domain_name_to_id(self, domain_name):
+    def zone_modified(self, domain):
+        """The DateModified of the domain as of its last records lookup."""
+        return self._zone_modified.get(domain)
+
+    def _map_domain_name_to_id(self, domain_name, deadline=None):
         """Map domain name to its BunnyDNS ID."""
-        # List Domains
-        domains = self.list_zones()
-        # Get Domain ID from list
-        domain_id = None
-        for domain in domains:
-            if domain["Domain"] == domain_name:
-                domain_id = domain["Id"]
+        domain_id = self._zone_ids.get(domain_name)
+        if domain_id is not None:
+            return domain_id
+        # Unknown (or new) domain, refresh the index by listing the domains
+        self.list_zones(deadline=deadline)
+        domain_id = self._zone_ids.get(domain_name)
         if domain_id is None:
             raise BunnyDNSClientAPIException404
 
@@ -231,9 +486,10 @@ class BunnyDNSClient:
         type_mapped = type_map[_type]
         return type_mapped
 
-    def lookup_domain_records(self, domain):
+    def lookup_domain_records(self, domain, deadline=None):
         """Lookup domain records from domain data."""
-        domain_contents = self.get_domain(domain)
+        domain_contents = self.get_domain(domain, deadline=deadline)
+        self._zone_modified[domain] = domain_contents.get("DateModified")
 
         # Abstract away the type IDs
         fixed_records = []
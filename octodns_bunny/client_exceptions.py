@@ -47,6 +47,36 @@ class BunnyDNSClientAPIException500(BunnyDNSClientAPIException):
             super().__init__(error_message)
 
 
+class BunnyDNSClientAPIException429(BunnyDNSClientAPIException):
+    """API exception - rate limited, the request was not processed."""
+
+    def __init__(self, error_message=None):
+        if error_message is None:
+            super().__init__("Too Many Requests")
+        else:
+            super().__init__(error_message)
+
+
+class BunnyDNSClientAPIExceptionServerError(BunnyDNSClientAPIException):
+    """API exception - server error other than 500 (e.g. 502, 503)."""
+
+    def __init__(self, error_message=None):
+        if error_message is None:
+            super().__init__("Server Error")
+        else:
+            super().__init__(error_message)
+
+
+class BunnyDNSClientAPIExceptionUnexpectedStatus(BunnyDNSClientAPIException):
+    """API exception - a response status the request doesn't expect."""
+
+    def __init__(self, error_message=None):
+        if error_message is None:
+            super().__init__("Unexpected Response Status")
+        else:
+            super().__init__(error_message)
+
+
 class BunnyDNSClientAPIExceptionDomainNotFound(BunnyDNSClientAPIException):
     """API exception - domain not found."""
 
@@ -55,3 +85,33 @@ class BunnyDNSClientAPIExceptionDomainNotFound(BunnyDNSClientAPIException):
             super().__init__("Domain Not Found")
         else:
             super().__init__(error_message)
+
+
+class BunnyDNSClientAPIExceptionTimeout(BunnyDNSClientAPIException):
+    """API exception - request timed out, the outcome is unknown."""
+
+    def __init__(self, error_message=None):
+        if error_message is None:
+            super().__init__("Request Timed Out")
+        else:
+            super().__init__(error_message)
+
+
+class BunnyDNSClientAPIExceptionCircuitOpen(BunnyDNSClientAPIException):
+    """API exception - the API is unhealthy, the request was not sent."""
+
+    def __init__(self, error_message=None):
+        if error_message is None:
+            super().__init__("Circuit Open")
+        else:
+            super().__init__(error_message)
+
+
+class BunnyDNSClientAPIExceptionDeadline(BunnyDNSClientAPIException):
+    """API exception - the time budget is exhausted, the request was not sent."""
+
+    def __init__(self, error_message=None):
+        if error_message is None:
+            super().__init__("Deadline Exceeded")
+        else:
+            super().__init__(error_message)
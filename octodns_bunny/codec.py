@@ -0,0 +1,64 @@
+"""JSON codecs used by the BunnyDNS client."""
+
+import json
+
+CODEC_AUTO = 'auto'
+CODEC_JSON = 'json'
+CODEC_ORJSON = 'orjson'
+
+
+class JSONCodec:
+    """The stdlib `json` codec."""
+
+    name = CODEC_JSON
+
+    def dumps(self, data):
+        """Encode data to JSON bytes."""
+        return json.dumps(data, allow_nan=False).encode('utf-8')
+
+    def loads(self, content):
+        """Decode JSON bytes."""
+        return json.loads(content)
+
+
+class OrjsonCodec:
+    """The `orjson` codec, decoding straight from the raw bytes."""
+
+    name = CODEC_ORJSON
+
+    # pylint can't see the members of the orjson extension module
+    # pylint: disable=no-member
+    def __init__(self):
+        # pylint: disable=import-outside-toplevel
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, data):
+        """Encode data to JSON bytes."""
+        return self._orjson.dumps(data)
+
+    def loads(self, content):
+        """Decode JSON bytes."""
+        return self._orjson.loads(content)
+
+
+CODECS = {CODEC_JSON: JSONCodec, CODEC_ORJSON: OrjsonCodec}
+
+
+def build_codec(name=CODEC_AUTO):
+    """
+    Build the named codec.
+
+    `auto` picks the fastest codec installed, falling back to stdlib json.
+    """
+    if name == CODEC_AUTO:
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            return JSONCodec()
+    try:
+        codec_class = CODECS[name]
+    except KeyError as exc:
+        raise ValueError(f"Unknown JSON codec: {name}") from exc
+    return codec_class()
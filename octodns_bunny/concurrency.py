@@ -0,0 +1,176 @@
+"""Concurrency helpers for the BunnyDNS client."""
+
+import threading
+import time
+from copy import deepcopy
+
+
+class _SingleFlightCall:
+    """A single in-flight call, shared by all callers with the same key."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.followers = 0
+        self.result = None
+        self.exception = None
+
+
+class SingleFlight:
+    """
+    Collapse concurrent identical calls into one.
+
+    The first caller for a given key (the leader) executes the call, all
+    other callers arriving while it is in flight wait for it and receive
+    a deep copy of its result (or the same exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func):
+        """
+        Run `func` for `key` unless an identical call is already in flight.
+
+        :return: a tuple of (result, shared), `shared` is True when the result
+                 was produced by another caller's request.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _SingleFlightCall()
+                self._calls[key] = call
+            else:
+                call.followers += 1
+
+        if not leader:
+            call.done.wait()
+            if call.exception is not None:
+                raise call.exception
+            # Callers are free to modify the returned data (and they do),
+            # so every follower gets its own copy.
+            return deepcopy(call.result), True
+
+        try:
+            result = func()
+        except BaseException as exc:
+            call.exception = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            if call.exception is None and call.followers:
+                # The leader may modify its own result as soon as we return,
+                # so the followers copy from a private snapshot.
+                call.result = deepcopy(result)
+            call.done.set()
+        return result, False
+
+
+def _smoothed(average, latency):
+    if average is None:
+        return latency
+    return 0.8 * average + 0.2 * latency
+
+
+class _LimiterSlot:
+    """A granted in-flight slot of the AdaptiveLimiter."""
+
+    def __init__(self, epoch, started, kind):
+        self.epoch = epoch
+        self.started = started
+        self.kind = kind
+
+
+class AdaptiveLimiter:
+    """
+    AIMD (additive increase, multiplicative decrease) in-flight limiter.
+
+    The limit grows by `increase / limit` with every healthy response (i.e.
+    roughly by `increase` per round trip of the whole window) and is
+    multiplied by `decrease` on overload: a 429/5xx response, a transport
+    error or a latency spike above `latency_spike` times the smoothed
+    healthy latency of the same kind of requests (see `acquire`). Only one
+    decrease happens per window of requests, the requests already in flight
+    when it happened are not counted again.
+    """
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def __init__(
+        self,
+        floor=1,
+        ceiling=16,
+        initial=None,
+        increase=1.0,
+        decrease=0.5,
+        latency_spike=3.0,
+    ):
+        if floor < 1 or ceiling < floor:
+            raise ValueError(
+                f"Invalid concurrency bounds: floor={floor}, ceiling={ceiling}"
+            )
+        self.floor = floor
+        self.ceiling = ceiling
+        self._increase = increase
+        self._decrease = decrease
+        self._latency_spike = latency_spike
+        self._limit = float(initial if initial is not None else floor)
+        self._limit = min(max(self._limit, floor), ceiling)
+        self._latency = None
+        # The smoothed healthy latency by kind of request
+        self._latencies = {}
+        self._epoch = 0
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self):
+        """The current in-flight request limit."""
+        return int(self._limit)
+
+    @property
+    def latency(self):
+        """The smoothed latency of healthy requests, in seconds."""
+        return self._latency
+
+    def acquire(self, kind=None):
+        """
+        Wait for a free slot and take it.
+
+        Latency spikes are only measured against requests of the same `kind`,
+        requests known to be slower (e.g. bigger responses) get their own.
+        """
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+            return _LimiterSlot(self._epoch, time.monotonic(), kind)
+
+    def release(self, slot, overloaded=False):
+        """
+        Return the slot and adapt the limit to how the request went.
+
+        `overloaded` is None for requests that say nothing about the API
+        health, these leave the limit as it is.
+        """
+        latency = time.monotonic() - slot.started
+        with self._cond:
+            self._in_flight -= 1
+            if overloaded is None:
+                self._cond.notify_all()
+                return
+            usual = self._latencies.get(slot.kind)
+            spike = usual is not None and latency > usual * self._latency_spike
+            if overloaded or spike:
+                if slot.epoch == self._epoch:
+                    self._epoch += 1
+                    self._limit = max(self.floor, self._limit * self._decrease)
+            else:
+                self._latencies[slot.kind] = _smoothed(usual, latency)
+                self._latency = _smoothed(self._latency, latency)
+                self._limit = min(
+                    self.ceiling, self._limit + self._increase / self._limit
+                )
+            self._cond.notify_all()
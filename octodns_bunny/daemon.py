@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+'''
+Reconcile BunnyDNS zones on a schedule, keeping the provider caches warm
+'''
+
+import logging
+import time
+
+from octodns.cmds.args import ArgumentParser
+from octodns.manager import Manager
+
+from .provider import BunnyDNSProvider
+
+log = logging.getLogger('BunnyDNSReconcile')
+
+
+def reconcile(manager, args):
+    """Run a single reconcile cycle."""
+    for provider in manager.providers.values():
+        if isinstance(provider, BunnyDNSProvider):
+            provider.start_run()
+            provider.revalidate_zones()
+    return manager.sync(
+        eligible_zones=args.zone,
+        eligible_sources=args.source,
+        eligible_targets=args.target,
+        dry_run=not args.doit,
+        force=args.force,
+    )
+
+
+def main():
+    """Console entry point."""
+    parser = ArgumentParser(description=__doc__.split('\n')[1])
+
+    parser.add_argument(
+        '--config-file',
+        required=True,
+        help='The Manager configuration file to use',
+    )
+    parser.add_argument(
+        '--doit',
+        action='store_true',
+        default=False,
+        help='Whether to take action or just show what would change',
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        default=False,
+        help='Acknowledge that significant changes are being made and do them',
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=60,
+        help='Seconds between the starts of two reconcile cycles',
+    )
+    parser.add_argument(
+        '--cycles',
+        type=int,
+        default=0,
+        help='Stop after this many cycles (default: run forever)',
+    )
+    parser.add_argument(
+        'zone',
+        nargs='*',
+        default=[],
+        help='Limit reconciling to the specified zone(s)',
+    )
+    parser.add_argument(
+        '--source',
+        default=[],
+        action='append',
+        help='Limit reconciling to zones with the specified source(s)',
+    )
+    parser.add_argument(
+        '--target',
+        default=[],
+        action='append',
+        help='Limit reconciling to the specified target(s)',
+    )
+
+    args = parser.parse_args()
+
+    # The manager, and thus the providers with their clients, connection
+    # pools and zone caches, live as long as the process does
+    manager = Manager(args.config_file)
+    cycle = 0
+    while True:
+        cycle += 1
+        started = time.monotonic()
+        try:
+            changes = reconcile(manager, args)
+            log.info(
+                'cycle %d: %s changes, took %.1fs',
+                cycle,
+                changes,
+                time.monotonic() - started,
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Keep running, the next cycle will try again
+            log.exception('cycle %d: failed', cycle)
+        if args.cycles and cycle >= args.cycles:
+            break
+        time.sleep(max(0, args.interval - (time.monotonic() - started)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+'''
+Dump all the zones of a BunnyDNS account, fetching them concurrently
+'''
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from octodns.cmds.args import ArgumentParser
+from octodns.manager import Manager
+from octodns.yaml import safe_dump
+
+from .provider import BunnyDNSProvider
+from .snapshot import write_snapshot
+
+log = logging.getLogger('BunnyDNSDump')
+
+FORMAT_JSON = 'json'
+FORMAT_SNAPSHOT = 'snapshot'
+FORMAT_YAML = 'yaml'
+FORMATS = (FORMAT_YAML, FORMAT_JSON, FORMAT_SNAPSHOT)
+
+
+class ZoneDumper:
+    """
+    Fetch zones concurrently and write each one out as soon as it arrives.
+
+    Every zone is converted with the provider's `_data_for_*` converters and
+    written to `<output_dir>/<zone>.<format>`, in the layout the octoDNS
+    `YamlProvider` reads. The `snapshot` format writes the records as
+    fetched instead, for the provider's `snapshot_dir`. At most `workers`
+    zones are held in memory at any time, no matter how many zones the
+    account has.
+    """
+
+    def __init__(self, provider, output_dir, fmt=FORMAT_YAML, workers=8):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format: {fmt}")
+        self.provider = provider
+        self.output_dir = output_dir
+        self.fmt = fmt
+        self.workers = max(1, workers)
+        self._lock = threading.Lock()
+        self.zones_done = 0
+        self.records_done = 0
+
+    def zone_data(self, domain):
+        """Fetch a zone and return its octoDNS data, by record name."""
+        provider = self.provider
+        records = provider._transform_records(
+            provider._client.lookup_domain_records(domain)
+        )
+        data = {}
+        for name, _, record_data in provider._zone_data(records):
+            if name in data:
+                if not isinstance(data[name], list):
+                    data[name] = [data[name]]
+                data[name].append(record_data)
+            else:
+                data[name] = record_data
+        return data, len(records)
+
+    def write(self, domain, data):
+        """Write the data of a zone, atomically."""
+        filename = os.path.join(self.output_dir, f'{domain}.{self.fmt}')
+        tmp = f'{filename}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as fh:
+            if self.fmt == FORMAT_JSON:
+                json.dump(data, fh, indent=2, sort_keys=True)
+            else:
+                safe_dump(data, fh)
+        os.replace(tmp, filename)
+        return filename
+
+    def dump_zone(self, domain, total):
+        """Fetch, convert and write a single zone."""
+        if self.fmt == FORMAT_SNAPSHOT:
+            client = self.provider._client
+            records = client.lookup_domain_records(domain)
+            write_snapshot(
+                self.output_dir,
+                domain,
+                records,
+                date_modified=client.zone_modified(domain),
+            )
+            count = len(records)
+        else:
+            data, count = self.zone_data(domain)
+            self.write(domain, data)
+        with self._lock:
+            self.zones_done += 1
+            self.records_done += count
+            log.info(
+                '%d/%d zones: %s, %d records',
+                self.zones_done,
+                total,
+                domain,
+                count,
+            )
+
+    def dump(self, domains):
+        """
+        Dump the zones, return the ones that failed.
+
+        Only `workers` zones are submitted at a time, so neither the queued
+        futures nor the zones in flight grow with the size of the account.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        total = len(domains)
+        failed = []
+        pending = {}
+        domains = iter(domains)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while True:
+                for domain in domains:
+                    future = executor.submit(self.dump_zone, domain, total)
+                    pending[future] = domain
+                    if len(pending) >= self.workers:
+                        break
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    domain = pending.pop(future)
+                    exc = future.exception()
+                    if exc is not None:
+                        log.error('%s: failed, %s', domain, exc)
+                        failed.append(domain)
+        return failed
+
+
+def main():
+    """Console entry point."""
+    parser = ArgumentParser(description=__doc__.split('\n')[1])
+
+    parser.add_argument(
+        '--config-file',
+        required=True,
+        help='The Manager configuration file to use',
+    )
+    parser.add_argument(
+        '--output-dir',
+        required=True,
+        help='The directory into which the zone files will be written',
+    )
+    parser.add_argument(
+        '--format',
+        choices=FORMATS,
+        default=FORMAT_YAML,
+        help='The format of the zone files',
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='The number of zones fetched concurrently',
+    )
+    parser.add_argument(
+        'source', help='The BunnyDNS provider (from the config) to dump'
+    )
+    parser.add_argument(
+        'zone',
+        nargs='*',
+        default=[],
+        help='Limit dumping to the specified zone(s), default: all zones',
+    )
+
+    args = parser.parse_args()
+
+    manager = Manager(args.config_file)
+    provider = manager.providers.get(args.source)
+    if not isinstance(provider, BunnyDNSProvider):
+        parser.error(f'{args.source} is not a BunnyDNSProvider')
+
+    if args.zone:
+        domains = [zone.rstrip('.') for zone in args.zone]
+    else:
+        domains = sorted(
+            zone['Domain'] for zone in provider._client.list_zones()
+        )
+
+    started = time.monotonic()
+    dumper = ZoneDumper(provider, args.output_dir, args.format, args.workers)
+    failed = dumper.dump(domains)
+    log.info(
+        'dumped %d zones, %d records, took %.1fs',
+        dumper.zones_done,
+        dumper.records_done,
+        time.monotonic() - started,
+    )
+    if failed:
+        parser.exit(1, f'Failed to dump: {", ".join(failed)}\n')
+
+
+if __name__ == '__main__':
+    main()
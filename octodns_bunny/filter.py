@@ -2,7 +2,10 @@
 
 # pylint: disable=protected-access
 
+import re
+
 from octodns.processor.base import BaseProcessor
+from octodns.record import Record
 
 
 class BunnyDNSFilter(BaseProcessor):
@@ -45,3 +48,132 @@ class BunnyDNSFilter(BaseProcessor):
             ]:
                 record.ttl = 0
         return zone
+
+
+BUNNYDNS_ZERO_TTL_TYPES = (
+    'BunnyDNSProvider/SCRIPT',
+    'BunnyDNSProvider/REDIRECT',
+)
+UNESCAPED_SEMICOLON = re.compile(r'(?<!\\);')
+
+
+def _fqdn(value):
+    """Exactly one trailing dot, the way octodns expects it."""
+    if value.rstrip('.') == '':
+        return '.'
+    return f"{value.rstrip('.')}."
+
+
+class BunnyDNSNormalizer(BaseProcessor):
+    '''
+    Normalizes both the source and the target zone the same way, so the
+    round-trip differences between octodns and BunnyDNS don't show up as
+    changes (each of which costs a delete and create cycle of API calls):
+
+    - unescaped `;` in TXT values are escaped,
+    - CNAME/ALIAS, MX, NS and SRV targets (and the CNAME/ALIAS `advanced`
+      keys) get exactly one trailing dot,
+    - script and redirect records get zero TTL (lenient ones included),
+    - the `advanced` settings are sorted.
+
+    Use in your config as:
+    processors:
+      bunnydns-normalize:
+        class: octodns_bunny.filter.BunnyDNSNormalizer
+    zones:
+      zone.org.:
+        sources:
+        - yaml_data
+        processors:
+        - bunnydns-normalize
+        targets:
+        - bunnydns
+    '''
+
+    # pylint: disable=arguments-differ
+    def process_source_zone(self, zone, *args, **kwargs):
+        # pylint: disable=unused-argument
+        return self._normalize_zone(zone)
+
+    # pylint: disable=arguments-differ
+    def process_target_zone(self, zone, *args, **kwargs):
+        # pylint: disable=unused-argument
+        return self._normalize_zone(zone)
+
+    def _normalize_zone(self, zone):
+        for record in zone.records:
+            if record._type in BUNNYDNS_ZERO_TTL_TYPES:
+                # Custom records are adjusted in place, like BunnyDNSFilter does
+                record.ttl = 0
+                continue
+            data = record.data
+            if self._normalize_data(record._type, data):
+                data['type'] = record._type
+                zone.add_record(
+                    Record.new(
+                        zone,
+                        record.name,
+                        data,
+                        source=record.source,
+                        lenient=True,
+                    ),
+                    replace=True,
+                    lenient=True,
+                )
+        return zone
+
+    def _normalize_data(self, _type, data):
+        """Normalize the record data in place, return True if it changed."""
+        changed = False
+        key = 'values' if 'values' in data else 'value'
+        values = data.get(key)
+        if values is not None:
+            single = key == 'value'
+            normalized = [
+                self._normalize_value(_type, v)
+                for v in ([values] if single else values)
+            ]
+            if any(n is not None for n in normalized):
+                changed = True
+                normalized = [
+                    v if n is None else n
+                    for v, n in zip(
+                        ([values] if single else values), normalized
+                    )
+                ]
+                data[key] = normalized[0] if single else normalized
+        advanced = (
+            data.get('octodns', {}).get('bunnydns', {}).get('advanced', None)
+        )
+        if advanced:
+            by_value = advanced
+            if _type in ('CNAME', 'ALIAS'):
+                # The values got their trailing dot above, so do their keys
+                by_value = {}
+                for value, entries in advanced.items():
+                    by_value.setdefault(_fqdn(value), []).extend(entries)
+            normalized = {
+                value: sorted(entries, key=lambda e: repr(sorted(e.items())))
+                for value, entries in sorted(by_value.items())
+            }
+            if list(normalized.items()) != list(advanced.items()):
+                changed = True
+                data['octodns']['bunnydns']['advanced'] = normalized
+        return changed
+
+    def _normalize_value(self, _type, value):
+        """Return the normalized value, or None when it's normalized already."""
+        if _type in ('TXT', 'SPF'):
+            normalized = UNESCAPED_SEMICOLON.sub(r'\\;', value)
+            return normalized if normalized != value else None
+        if _type in ('CNAME', 'ALIAS', 'NS'):
+            return _fqdn(value) if _fqdn(value) != value else None
+        if _type == 'MX':
+            field = 'exchange'
+        elif _type == 'SRV':
+            field = 'target'
+        else:
+            return None
+        if _fqdn(value[field]) == value[field]:
+            return None
+        return {**value, field: _fqdn(value[field])}
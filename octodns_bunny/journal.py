@@ -0,0 +1,158 @@
+"""On-disk journal of the completed BunnyDNS API mutations."""
+
+import hashlib
+import json
+import os
+import threading
+from collections import defaultdict
+
+JOURNAL_CREATE = 'create'
+JOURNAL_DELETE = 'delete'
+
+
+def body_hash(body):
+    """A stable hash of a request body."""
+    return hashlib.sha256(
+        json.dumps(body, sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+
+
+def desired_key(desired):
+    """
+    A stable hash of the desired state of a zone, keying its journal.
+
+    A later run (e.g. after the process was killed) planning the same
+    desired state from the partially changed zone computes the same key and
+    resumes the journal, whatever changes are left in its plan.
+    """
+    return body_hash(
+        sorted(
+            [record.name, record._type, record.data]
+            for record in desired.records
+        )
+    )
+
+
+class ChangeJournal:
+    """
+    Journal of the API mutations completed while applying a desired state.
+
+    Every completed mutation is appended (and flushed) to a JSON lines file
+    per zone, the first line identifies the desired state (see
+    `desired_key`). When the same desired state is applied again, e.g. by
+    the next run after a timeout or a crash, the journaled creates are
+    checked against the live zone (`verify`). The ones found there are
+    neither created nor deleted again. The journal of another desired state
+    is discarded, and the journal is removed once the plan is fully applied.
+    """
+
+    def __init__(self, directory, zone_name, key):
+        self.path = os.path.join(directory, f'{zone_name}journal')
+        self.zone_name = zone_name
+        self.key = key
+        # (operation, key) -> the record IDs of the completed steps
+        self._completed = defaultdict(list)
+        # The IDs of the records created by previous attempts
+        self._created = set()
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        resumed = self._load()
+        # pylint: disable=consider-using-with
+        self._fh = open(self.path, 'a' if resumed else 'w', encoding='utf-8')
+        if not resumed:
+            self._write({'desired': key})
+
+    @property
+    def resumed_steps(self):
+        """Number of completed creates loaded from a previous attempt."""
+        return sum(len(ids) for ids in self._completed.values())
+
+    def _load(self):
+        """Load the steps completed for the same desired state, if any."""
+        try:
+            with open(self.path, encoding='utf-8') as fh:
+                lines = [json.loads(line) for line in fh if line.strip()]
+        except (OSError, ValueError):
+            return False
+        if not lines or lines[0].get('desired') != self.key:
+            return False
+        for entry in lines[1:]:
+            # Deletes are never skipped on the journal's word, the live zone
+            # tells whether a record is still there
+            if entry['operation'] == JOURNAL_CREATE:
+                self._completed[(entry['operation'], entry['key'])].append(
+                    entry.get('record_id')
+                )
+        return True
+
+    def _write(self, entry):
+        self._fh.write(json.dumps(entry, sort_keys=True) + '\n')
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+
+    def verify(self, record_ids):
+        """
+        Keep only the journaled creates whose records are in the zone.
+
+        The zone may have changed since (e.g. been rolled back), a create
+        whose record is gone is done again.
+
+        :param record_ids: the IDs of the records currently in the zone
+        :return: the number of journaled steps dropped
+        """
+        record_ids = set(record_ids)
+        dropped = 0
+        with self._lock:
+            for step, ids in self._completed.items():
+                kept = [i for i in ids if i is not None and i in record_ids]
+                dropped += len(ids) - len(kept)
+                self._completed[step] = kept
+                self._created.update(kept)
+        return dropped
+
+    def created(self, record_id):
+        """
+        Whether a record was created by a previous attempt (and verified).
+
+        Such a record is part of the desired state, an Update resumed from
+        the journal must not delete it again.
+        """
+        with self._lock:
+            return record_id in self._created
+
+    def completed(self, operation, key):
+        """
+        Consume a verified step completed by a previous attempt.
+
+        Identical steps (e.g. the same body created twice) are counted.
+
+        :return: the record ID of the step, None if there is none
+        """
+        with self._lock:
+            ids = self._completed.get((operation, key))
+            if ids:
+                return ids.pop()
+        return None
+
+    def record(self, operation, key, record_id=None):
+        """Record a completed step."""
+        with self._lock:
+            self._write(
+                {
+                    'zone': self.zone_name,
+                    'operation': operation,
+                    'key': key,
+                    'record_id': record_id,
+                }
+            )
+
+    def complete(self):
+        """The whole plan has been applied, drop the journal."""
+        with self._lock:
+            self._fh.close()
+            os.remove(self.path)
+
+    def close(self):
+        """Close the journal, keeping it for the next attempt."""
+        with self._lock:
+            self._fh.close()
@@ -0,0 +1,68 @@
+"""Per-zone profiling of the provider's hot paths."""
+
+import cProfile
+import functools
+import io
+import logging
+import os
+import pstats
+
+# Enables the profiling when the provider's `profile_dir` isn't set
+PROFILE_DIR_ENV = 'OCTODNS_BUNNY_PROFILE_DIR'
+
+
+class ZoneProfiler:
+    """
+    Profile calls per zone with cProfile.
+
+    The stats of every profiled call are written to
+    `<directory>/<zone>.<stage>.prof` (replacing the ones of the previous
+    call), to be inspected with `pstats` or e.g. snakeviz, and the `top`
+    functions by cumulative time are logged.
+    """
+
+    def __init__(self, directory, top=10, log=None):
+        self.directory = directory
+        self.top = top
+        self.log = log or logging.getLogger('BunnyDNSProfiler')
+        os.makedirs(directory, exist_ok=True)
+
+    def wrap(self, stage, method, zone_name):
+        """
+        Wrap `method`, profiling every call.
+
+        `zone_name` returns the name of the zone a call is about, given the
+        call's arguments.
+        """
+
+        @functools.wraps(method)
+        def profiled(*args, **kwargs):
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                # Another profiler is active (e.g. in another thread)
+                self.log.debug('%s: profiler busy, not profiling', stage)
+                return method(*args, **kwargs)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                profiler.disable()
+                self._report(stage, zone_name(*args, **kwargs), profiler)
+
+        return profiled
+
+    def _report(self, stage, zone, profiler):
+        filename = os.path.join(self.directory, f'{zone}{stage}.prof')
+        profiler.dump_stats(filename)
+        out = io.StringIO()
+        stats = pstats.Stats(profiler, stream=out)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        self.log.info(
+            '%s %s: %.3fs total, stats in %s\n%s',
+            zone,
+            stage,
+            stats.total_tt,
+            filename,
+            out.getvalue().strip(),
+        )
@@ -3,15 +3,38 @@
 # pylint: disable=invalid-name
 # pylint: disable=protected-access
 # pylint: disable=redefined-builtin
+import hashlib
+import json
 import logging
+import os
+import threading
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from octodns.provider import ProviderException
 from octodns.provider.base import BaseProvider
-from octodns.record import Record, Update
-
-from .client import BunnyDNSClient
-from .client_exceptions import BunnyDNSClientAPIExceptionDomainNotFound
+from octodns.record import Record, Update, ValidationError
+
+from .client import DEFAULT_API_URL, BunnyDNSClient
+from .client_exceptions import (
+    BunnyDNSClientAPIExceptionDeadline,
+    BunnyDNSClientAPIExceptionDomainNotFound,
+    BunnyDNSClientAPIExceptionTimeout,
+)
+from .codec import CODEC_AUTO
+from .journal import (
+    JOURNAL_CREATE,
+    JOURNAL_DELETE,
+    ChangeJournal,
+    body_hash,
+    desired_key,
+)
+from .profiling import PROFILE_DIR_ENV, ZoneProfiler
+from .sharding import assign_shards, hash_shard
+from .snapshot import read_snapshot
+from .transport import TRANSPORT_REQUESTS
 
 OCTODNS_MONITOR_NONE = 'none'
 ALLOWED_MONITORS = {OCTODNS_MONITOR_NONE: 0, "ping": 1, "http": 2}
@@ -33,6 +56,26 @@ OCTODNS_FIELD_LONGITUDE = 'longitude'
 OCTODNS_FIELD_MONITOR = 'monitor'
 OCTODNS_FIELD_WEIGHT = 'weight'
 OCTODNS_FIELD_SMART_ROUTING = 'smart_routing'
+# The record fields the zone content hash is computed from
+CONTENT_HASH_FIELDS = (
+    'Type',
+    'Name',
+    'Ttl',
+    'Value',
+    'Priority',
+    'Port',
+    'Weight',
+    'Flags',
+    'Tag',
+    'LinkName',
+    'Disabled',
+    'Accelerated',
+    'SmartRoutingType',
+    'MonitorType',
+    'LatencyZone',
+    'GeolocationLatitude',
+    'GeolocationLongitude',
+)
 SMART_ROUTING_MAP = {
     OCTODNS_ROUTING_NONE: SMART_ROUTING_NONE,
     OCTODNS_ROUTING_LATENCY: SMART_ROUTING_LATENCY,
@@ -44,6 +87,31 @@ class BunnyDNSProviderException(ProviderException):
     """BunnyDNS Provider Exception class."""
 
 
+class BunnyDNSProviderDeadlineExceeded(BunnyDNSProviderException):
+    """The time budget of the run ran out, between two changes."""
+
+
+class ZoneApplyResult:
+    """The outcome of applying the plan of a single zone, see apply_many()."""
+
+    def __init__(self, zone_name, applied=0, error=None, elapsed=0.0):
+        self.zone_name = zone_name
+        self.applied = applied
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        """Whether the plan was applied completely."""
+        return self.error is None
+
+    def __repr__(self):
+        return (
+            f'<ZoneApplyResult {self.zone_name} applied={self.applied} '
+            f'error={self.error!r} elapsed={self.elapsed:.3f}>'
+        )
+
+
 class BunnyDNSProvider(BaseProvider):
     """Main OctoDNS provider for BunnyDNS."""
 
@@ -66,14 +134,201 @@ class BunnyDNSProvider(BaseProvider):
         "BunnyDNSProvider/REDIRECT",
     }
 
-    def __init__(self, id, token, *args, **kwargs):
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        id,
+        token,
+        *args,
+        api_url=DEFAULT_API_URL,
+        share_client=True,
+        min_concurrency=1,
+        max_concurrency=16,
+        circuit_failure_threshold=5,
+        circuit_error_rate=0.5,
+        circuit_window=20,
+        circuit_reset_timeout=30,
+        transport=TRANSPORT_REQUESTS,
+        json_codec=CODEC_AUTO,
+        record_file=None,
+        replay_file=None,
+        replay_latency=0.0,
+        accelerated_create_timeout=None,
+        accelerated_confirm_timeout=120,
+        accelerated_poll_interval=5,
+        journal_dir=None,
+        skip_unchanged_zones=False,
+        zone_state_file=None,
+        trusted_populate=False,
+        profile_dir=None,
+        profile_top=10,
+        snapshot_dir=None,
+        snapshot_max_age=0,
+        time_budget=None,
+        warm_up=False,
+        warm_up_zones=None,
+        shard_index=0,
+        shard_count=1,
+        **kwargs,
+    ):
         self.log = logging.getLogger(f"BunnyDNSProvider[{id}]")
-        self.log.debug("__init__: id=%s, token=***", id)
+        self.log.debug(
+            "__init__: id=%s, token=***, api_url=%s, share_client=%s",
+            id,
+            api_url,
+            share_client,
+        )
         super().__init__(id, *args, **kwargs)
-        self._client = BunnyDNSClient(token=token)
+        # The client (and its HTTP session) is only built on first use,
+        # providers which end up unused in a run cost next to nothing
+        self._client_instance = None
+        self._client_lock = threading.Lock()
+        self._share_client = share_client
+        self._client_kwargs = {
+            "token": token,
+            "api_url": api_url,
+            "min_concurrency": min_concurrency,
+            "max_concurrency": max_concurrency,
+            "circuit_failure_threshold": circuit_failure_threshold,
+            "circuit_error_rate": circuit_error_rate,
+            "circuit_window": circuit_window,
+            "circuit_reset_timeout": circuit_reset_timeout,
+            "transport": transport,
+            "json_codec": json_codec,
+            "record_file": record_file,
+            "replay_file": replay_file,
+            "replay_latency": replay_latency,
+        }
+        # When set, accelerated records are only submitted (with this timeout)
+        # and their creation is confirmed by polling the zone after the
+        # rest of the changes went out
+        self.accelerated_create_timeout = accelerated_create_timeout
+        self.accelerated_confirm_timeout = accelerated_confirm_timeout
+        self.accelerated_poll_interval = accelerated_poll_interval
+        # When set, completed API mutations are journaled there, so
+        # applying the same desired state again continues where it failed
+        self.journal_dir = journal_dir
+        # When set, zones whose content and desired state didn't change
+        # since they were last found in sync are not planned at all
+        self.skip_unchanged_zones = skip_unchanged_zones
+        self.zone_state_file = zone_state_file
+        self._zone_states = None
+        self._zone_states_lock = threading.Lock()
+        # When set, zones are populated from their snapshots there (when
+        # found) instead of the API. Zones with snapshots older than
+        # snapshot_max_age are fetched again before applying them
+        self.snapshot_dir = snapshot_dir
+        self.snapshot_max_age = snapshot_max_age
+        self._zone_snapshots = {}
+        # Applying stops (between two changes) once the time budget of the
+        # run is spent. It's counted from the first plan() or apply() of the
+        # run, see start_run() and set_deadline()
+        self.time_budget = time_budget
+        self._deadline = None
+        self._run_started = False
+        # Skip the record validation when populating as a target
+        self.trusted_populate = trusted_populate
+        # Profile populate, _extra_changes and _apply per zone. The methods
+        # are only wrapped when enabled, costing nothing otherwise
+        profile_dir = profile_dir or os.environ.get(PROFILE_DIR_ENV)
+        if profile_dir:
+            profiler = ZoneProfiler(profile_dir, top=profile_top, log=self.log)
+            self.populate = profiler.wrap(
+                'populate', self.populate, lambda zone, *_, **__: zone.name
+            )
+            self._extra_changes = profiler.wrap(
+                '_extra_changes',
+                self._extra_changes,
+                lambda existing, desired, *_, **__: desired.name,
+            )
+            self._apply = profiler.wrap(
+                '_apply', self._apply, lambda plan, *_, **__: plan.desired.name
+            )
 
         self._zone_records = {}
 
+        # Only the zones of this shard are listed and planned, the zones are
+        # split by their record count, see assign_shards(). The values may
+        # come from environment variables, i.e. strings
+        shard_index, shard_count = int(shard_index), int(shard_count)
+        if shard_count < 1 or not 0 <= shard_index < shard_count:
+            raise BunnyDNSProviderException(
+                f"Invalid shard {shard_index} of {shard_count} shards"
+            )
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self._shards = None
+
+        # Build the client, list the zones and prefetch some zones in the
+        # background, while octoDNS is busy loading the sources
+        self._warm_up_thread = None
+        if warm_up:
+            self._warm_up_thread = threading.Thread(
+                target=self._warm_up,
+                args=([f"{z.rstrip('.')}." for z in warm_up_zones or []],),
+                name=f"BunnyDNSProvider[{id}] warm-up",
+                daemon=True,
+            )
+            self._warm_up_thread.start()
+
+    def _warm_up(self, zone_names):
+        """Fill the zone index and prefetch the zones (in the background)."""
+        started = time.monotonic()
+        try:
+            self._client.list_zones()
+            if zone_names:
+                with ThreadPoolExecutor(
+                    max_workers=min(len(zone_names), 4)
+                ) as executor:
+                    for zone_name, records in zip(
+                        zone_names, executor.map(self._prefetch, zone_names)
+                    ):
+                        if records is not None:
+                            self._zone_records[zone_name] = records
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # Nothing lost, the data is fetched again when it's needed
+            self.log.warning("_warm_up: failed, %s", exc)
+            return
+        self.log.debug(
+            "_warm_up: done, %d zones prefetched, took %.2fs",
+            len(zone_names),
+            time.monotonic() - started,
+        )
+
+    def _prefetch(self, zone_name):
+        try:
+            return self._transform_records(
+                self._client.lookup_domain_records(zone_name[:-1])
+            )
+        except BunnyDNSClientAPIExceptionDomainNotFound:
+            return None
+
+    def _wait_for_warm_up(self):
+        """Let the warm-up finish, its results are used from then on."""
+        thread = self._warm_up_thread
+        if thread is not None:
+            thread.join()
+            self._warm_up_thread = None
+
+    @property
+    def _client(self):
+        """The BunnyDNS client, built on first use."""
+        if self._client_instance is None:
+            with self._client_lock:
+                if self._client_instance is None:
+                    if self._share_client:
+                        # Providers with the same account share the client,
+                        # its connection pool, zone ID index, concurrency
+                        # limiter and circuit breaker
+                        self._client_instance = BunnyDNSClient.shared(
+                            **self._client_kwargs
+                        )
+                    else:
+                        self._client_instance = BunnyDNSClient(
+                            **self._client_kwargs
+                        )
+        return self._client_instance
+
     def _merge(self, source, destination):
         """
         run me with nosetests --with-doctest file.py
@@ -294,96 +549,77 @@ class BunnyDNSProvider(BaseProvider):
         """Try to figure out what the default weight should be."""
         smart_routing = self._to_smart_routing_type(record)
         # default weight is 0, unless smart_routing is enabled, then it's 100
-        return 100 if smart_routing else 0
+        return DEFAULT_SMART_WEIGHT if smart_routing else 0
 
-    def _params_for_A(self, record):
-        # We may have the same IP repeated multiple times, with different values,
-        # let's try to work around that
-        advanced_settings = record.octodns.get(OCTODNS_FIELD_BUNNYDNS, {}).get(
-            OCTODNS_FIELD_ADVANCED, {}
-        )
-        for value in record.values:
-            values_advanced_setting = advanced_settings.get(value, [])
-            if values_advanced_setting:
-                value_advanced_setting = values_advanced_setting[0]
-                advanced_settings.get(value, []).remove(value_advanced_setting)
+    def _params_for_advanced(self, record, values, accelerated):
+        """
+        Build the bodies of records supporting the advanced settings.
+
+        The record-level settings are resolved once per record. Repeated
+        values are matched to their advanced entries in order (the first
+        occurrence of a value gets the first entry and so on), without
+        modifying the record, so the bodies can be built more than once.
+        """
+        bunnydns = record.octodns.get(OCTODNS_FIELD_BUNNYDNS, {})
+        advanced_settings = bunnydns.get(OCTODNS_FIELD_ADVANCED, {})
+        if not self._is_dict(advanced_settings):
+            advanced_settings = {}
+        smart_routing_type = self._to_smart_routing_type(record)
+        default_weight = self.get_weight_default_by_smart_routing(record)
+        record_params = {
+            "Name": record.name,
+            "Ttl": record.ttl,
+            "Type": record._type,
+            "SmartRoutingType": smart_routing_type,
+        }
+        if accelerated:
+            record_params["Accelerated"] = self._to_accelerated(record)
+        seen = defaultdict(int)
+        for value in values:
+            value_advanced_settings = advanced_settings.get(value) or []
+            index = seen[value]
+            seen[value] += 1
+            if index < len(value_advanced_settings):
+                setting = value_advanced_settings[index]
             else:
-                value_advanced_setting = {}
+                setting = {}
             yield {
                 "Value": value,
-                "Name": record.name,
-                "Ttl": record.ttl,
-                "Type": record._type,
+                **record_params,
                 "Disabled": self._get_from_advanced_setting(
-                    value_advanced_setting, OCTODNS_FIELD_DISABLED, False
+                    setting, OCTODNS_FIELD_DISABLED, False
                 ),
-                "Accelerated": self._to_accelerated(record),
-                "SmartRoutingType": self._to_smart_routing_type(record),
                 "Weight": self._get_from_advanced_setting(
-                    value_advanced_setting,
-                    OCTODNS_FIELD_WEIGHT,
-                    self.get_weight_default_by_smart_routing(record),
+                    setting, OCTODNS_FIELD_WEIGHT, default_weight
                 ),
                 "MonitorType": self._get_from_advanced_setting(
-                    value_advanced_setting,
+                    setting,
                     OCTODNS_FIELD_MONITOR,
                     OCTODNS_MONITOR_NONE,
                     ALLOWED_MONITORS,
                 ),
                 "LatencyZone": self._get_from_advanced_setting(
-                    value_advanced_setting, OCTODNS_FIELD_LATENCY_ZONE, ''
+                    setting, OCTODNS_FIELD_LATENCY_ZONE, ''
                 ),
                 "GeolocationLatitude": self._get_from_advanced_setting(
-                    value_advanced_setting, OCTODNS_FIELD_LATITUDE, 0
+                    setting, OCTODNS_FIELD_LATITUDE, 0
                 ),
                 "GeolocationLongitude": self._get_from_advanced_setting(
-                    value_advanced_setting, OCTODNS_FIELD_LONGITUDE, 0
+                    setting, OCTODNS_FIELD_LONGITUDE, 0
                 ),
             }
 
+    def _params_for_A(self, record):
+        # We may have the same IP repeated multiple times, with different values
+        return self._params_for_advanced(
+            record, record.values, accelerated=True
+        )
+
     def _params_for_AAAA(self, record):
-        # We may have the same IP repeated multiple times, with different values,
-        # let's try to work around that
-        advanced_settings = record.octodns.get(OCTODNS_FIELD_BUNNYDNS, {}).get(
-            OCTODNS_FIELD_ADVANCED, {}
+        # We may have the same IP repeated multiple times, with different values
+        return self._params_for_advanced(
+            record, record.values, accelerated=False
         )
-        for value in record.values:
-            values_advanced_setting = advanced_settings.get(value, [])
-            if values_advanced_setting:
-                value_advanced_setting = values_advanced_setting[0]
-                advanced_settings.get(value, []).remove(value_advanced_setting)
-            else:
-                value_advanced_setting = {}
-            yield {
-                "Value": value,
-                "Name": record.name,
-                "Ttl": record.ttl,
-                "Type": record._type,
-                "Disabled": self._get_from_advanced_setting(
-                    value_advanced_setting, OCTODNS_FIELD_DISABLED, False
-                ),
-                "SmartRoutingType": self._to_smart_routing_type(record),
-                "Weight": self._get_from_advanced_setting(
-                    value_advanced_setting,
-                    OCTODNS_FIELD_WEIGHT,
-                    self.get_weight_default_by_smart_routing(record),
-                ),
-                "MonitorType": self._get_from_advanced_setting(
-                    value_advanced_setting,
-                    OCTODNS_FIELD_MONITOR,
-                    OCTODNS_MONITOR_NONE,
-                    ALLOWED_MONITORS,
-                ),
-                "LatencyZone": self._get_from_advanced_setting(
-                    value_advanced_setting, OCTODNS_FIELD_LATENCY_ZONE, ''
-                ),
-                "GeolocationLatitude": self._get_from_advanced_setting(
-                    value_advanced_setting, OCTODNS_FIELD_LATITUDE, 0
-                ),
-                "GeolocationLongitude": self._get_from_advanced_setting(
-                    value_advanced_setting, OCTODNS_FIELD_LONGITUDE, 0
-                ),
-            }
 
     def _params_for_ALIAS(self, record):
         # Fall through to CNAME
@@ -391,48 +627,10 @@ class BunnyDNSProvider(BaseProvider):
 
     def _params_for_CNAME(self, record):
         # We should NOT have the same IP repeated multiple times, with different values,
-        # although BunnyDNS allows that, so let's try to work around that
-        advanced_settings = record.octodns.get(OCTODNS_FIELD_BUNNYDNS, {}).get(
-            OCTODNS_FIELD_ADVANCED, {}
+        # although BunnyDNS allows that, so there's a single value only
+        return self._params_for_advanced(
+            record, [record.value], accelerated=True
         )
-        value = record.value
-        values_advanced_setting = advanced_settings.get(value, [])
-        if values_advanced_setting:
-            value_advanced_setting = values_advanced_setting[0]
-            advanced_settings.get(value, []).remove(value_advanced_setting)
-        else:
-            value_advanced_setting = {}
-        yield {
-            "Value": record.value,
-            "Name": record.name,
-            "Ttl": record.ttl,
-            "Type": record._type,
-            "Disabled": self._get_from_advanced_setting(
-                value_advanced_setting, OCTODNS_FIELD_DISABLED, False
-            ),
-            "Accelerated": self._to_accelerated(record),
-            "SmartRoutingType": self._to_smart_routing_type(record),
-            "Weight": self._get_from_advanced_setting(
-                value_advanced_setting,
-                OCTODNS_FIELD_WEIGHT,
-                self.get_weight_default_by_smart_routing(record),
-            ),
-            "MonitorType": self._get_from_advanced_setting(
-                value_advanced_setting,
-                OCTODNS_FIELD_MONITOR,
-                OCTODNS_MONITOR_NONE,
-                ALLOWED_MONITORS,
-            ),
-            "LatencyZone": self._get_from_advanced_setting(
-                value_advanced_setting, OCTODNS_FIELD_LATENCY_ZONE, ''
-            ),
-            "GeolocationLatitude": self._get_from_advanced_setting(
-                value_advanced_setting, OCTODNS_FIELD_LATITUDE, 0
-            ),
-            "GeolocationLongitude": self._get_from_advanced_setting(
-                value_advanced_setting, OCTODNS_FIELD_LONGITUDE, 0
-            ),
-        }
 
     def _params_for_TXT(self, record):
         # DigitalOcean doesn't want things escaped in values, so we
@@ -475,7 +673,7 @@ class BunnyDNSProvider(BaseProvider):
                 "Name": record.name,
                 "Tag": value.tag,
                 "Ttl": record.ttl,
-                "RecordType": record._type,
+                "Type": record._type,
             }
 
     def _params_for_PTR(self, record):
@@ -553,33 +751,161 @@ class BunnyDNSProvider(BaseProvider):
 
     def zone_records(self, zone):
         """Return zone records."""
+        self._wait_for_warm_up()
+        if zone.name not in self._zone_records and self.snapshot_dir:
+            snapshot = read_snapshot(self.snapshot_dir, zone.name)
+            if snapshot is not None:
+                self.log.debug("zone_records:   %s from snapshot", zone.name)
+                self._zone_snapshots[zone.name] = snapshot["Fetched"]
+                self._zone_records[zone.name] = self._transform_records(
+                    snapshot["Records"]
+                )
         if zone.name not in self._zone_records:
             try:
                 self._zone_records[zone.name] = self._transform_records(
-                    self._client.lookup_domain_records(zone.name[:-1])
+                    self._client.lookup_domain_records(
+                        zone.name[:-1], deadline=self._deadline
+                    )
                 )
             except BunnyDNSClientAPIExceptionDomainNotFound:
                 return []
 
         return self._zone_records[zone.name]
 
+    def revalidate_zones(self):
+        """
+        Drop the cached records of the zones modified since their lookup.
+
+        Long-running processes call this before each sync, so that only
+        the zones whose `DateModified` moved get downloaded again.
+        """
+        zones = self._client.list_zones()
+        self._update_shards(zones)
+        modified = {zone["Domain"]: zone.get("DateModified") for zone in zones}
+        for zone_name in list(self._zone_records):
+            domain = zone_name[:-1]
+            if modified.get(domain) != self._client.zone_modified(domain):
+                self.log.debug("revalidate_zones:   %s modified", zone_name)
+                self._zone_records.pop(zone_name, None)
+
     def list_zones(self):
         """List zones."""
         self.log.debug("list_zones:")
-        domains = [f'{domain["Name"]}.' for domain in self._client.list_zones()]
+        self._wait_for_warm_up()
+        zones = self._client.list_zones()
+        self._update_shards(zones)
+        domains = [
+            f'{zone["Domain"]}.'
+            for zone in zones
+            if self._in_shard(zone["Domain"])
+        ]
         return sorted(domains)
 
-    def populate(self, zone, target=False, lenient=False):
-        """Populate the zone with data."""
-        self.log.debug(
-            "populate: name=%s, target=%s, lenient=%s",
-            zone.name,
-            target,
-            lenient,
-        )
+    def _update_shards(self, zones):
+        if self.shard_count > 1:
+            self._shards = assign_shards(zones, self.shard_count)
+
+    def _in_shard(self, domain):
+        """Whether a zone (name without the trailing dot) is ours."""
+        if self.shard_count == 1:
+            return True
+        if self._shards is None:
+            self._update_shards(self._client.list_zones())
+        shard = self._shards.get(domain)
+        if shard is None:
+            shard = hash_shard(domain, self.shard_count)
+        return shard == self.shard_index
+
+    def _content_hash(self, records):
+        """Hash of the (normalized) BunnyDNS records of a zone."""
+        return hashlib.sha256(
+            "\n".join(
+                sorted(
+                    json.dumps(
+                        [record.get(field) for field in CONTENT_HASH_FIELDS],
+                        default=str,
+                    )
+                    for record in records
+                )
+            ).encode("utf-8")
+        ).hexdigest()
 
+    def _desired_hash(self, desired, processors):
+        """
+        Hash of the desired zone (and the processors applied to it).
+
+        The complete data of the records is hashed, octodns settings
+        included, so an edit of e.g. the bunnydns advanced settings alone is
+        planned too.
+        """
+        lines = [desired_key(desired)]
+        lines.extend(getattr(p, "id", repr(p)) for p in processors)
+        return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+    def _load_zone_states(self):
+        if self._zone_states is None:
+            self._zone_states = {}
+            if self.zone_state_file and os.path.exists(self.zone_state_file):
+                with open(self.zone_state_file, encoding="utf-8") as fh:
+                    self._zone_states = json.load(fh)
+        return self._zone_states
+
+    def _save_zone_state(self, zone_name, state):
+        # Zones may be planned and applied concurrently, see apply_many()
+        with self._zone_states_lock:
+            states = self._load_zone_states()
+            if state is None:
+                if states.pop(zone_name, None) is None:
+                    return
+            else:
+                states[zone_name] = state
+            if self.zone_state_file:
+                tmp = f"{self.zone_state_file}.tmp"
+                with open(tmp, "w", encoding="utf-8") as fh:
+                    json.dump(states, fh, indent=1, sort_keys=True)
+                os.replace(tmp, self.zone_state_file)
+
+    def plan(self, desired, *args, **kwargs):
+        """
+        Plan the changes, short-circuiting zones known to be in sync.
+
+        With `skip_unchanged_zones`, a zone whose BunnyDNS content and
+        desired state both hash to the same values as when it was last
+        found in sync is reported unchanged without building any records.
+        Zones of other shards are never planned.
+        """
+        self._start_deadline()
+        if not self._in_shard(desired.name[:-1]):
+            self.log.info(
+                "plan: desired=%s, in another shard, skipping", desired.name
+            )
+            return None
+        if not self.skip_unchanged_zones:
+            return super().plan(desired, *args, **kwargs)
+        processors = args[0] if args else kwargs.get("processors", [])
+        state = [
+            self._content_hash(self.zone_records(desired)),
+            self._desired_hash(desired, processors),
+        ]
+        if self._load_zone_states().get(desired.name) == state:
+            self.log.info(
+                "plan: desired=%s, unchanged since the last sync", desired.name
+            )
+            return None
+        plan = super().plan(desired, *args, **kwargs)
+        # Only a zone found to be in sync is remembered, the content of an
+        # applied zone is only known after it is downloaded again
+        self._save_zone_state(desired.name, state if plan is None else None)
+        return plan
+
+    def _zone_data(self, records):
+        """
+        Convert the (transformed) records of a zone to octoDNS record data.
+
+        :return: an iterator of (name, type, data) tuples
+        """
         values = defaultdict(lambda: defaultdict(list))
-        for record in self.zone_records(zone):
+        for record in records:
             _type = record["Type"]
             if _type not in self.SUPPORTS:
                 self.log.warning(
@@ -588,19 +914,85 @@ class BunnyDNSProvider(BaseProvider):
                 continue
             values[record["Name"]][record["Type"]].append(record)
 
-        before = len(zone.records)
         for name, types in values.items():
-            for _type, records in types.items():
+            for _type, type_records in types.items():
                 _class_method = _type.replace('BunnyDNSProvider/', '')
                 data_for = getattr(self, f"_data_for_{_class_method}")
-                record = Record.new(
-                    zone,
-                    name,
-                    data_for(_type, records),
-                    source=self,
-                    lenient=lenient,
+                yield name, _type, data_for(_type, type_records)
+
+    def _trusted_validators(self, zone):
+        """
+        The record-wide validators (name, ttl...) run by trusted populates.
+
+        The per-type and per-value validators, most of the validation cost,
+        are skipped.
+
+        :return: a list of functions returning the problems found in the
+                 (name, fqdn, data) of a record
+        """
+        validators = getattr(Record, 'validators', None)
+        if validators is None:
+            # Older octodns without the validator registry, the base Record
+            # validates the record-wide bits
+            return [Record.validate]
+        if not validators.configured:
+            validators.enable_sets({'legacy'})
+        disabled = zone.disabled_record_validators
+        skip = disabled.get('*', ())
+        return [
+            partial(validator.validate, Record, disabled=disabled)
+            for validator in validators.registered()['record'].get('*', [])
+            if validator.id not in skip
+        ]
+
+    def _trusted_record(self, zone, name, _type, data, validators):
+        """
+        Build a record from converter output without fully validating it.
+
+        The data comes straight from BunnyDNS through our own converters,
+        so only the record-wide `validators` run and their problems are
+        logged as warnings, as lenient populates do. A record that can't be
+        built at all is skipped with a warning.
+        """
+        fqdn = f'{name}.{zone.name}' if name else zone.name
+        reasons = [
+            str(reason)
+            for validator in validators
+            for reason in validator(name, fqdn, data)
+        ]
+        if reasons:
+            self.log.warning(ValidationError.build_message(fqdn, reasons))
+        try:
+            # pylint: disable=protected-access
+            return Record._CLASSES[_type](zone, name, data, source=self)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self.log.warning(
+                "populate: skipping invalid %s record %s, %s", _type, fqdn, exc
+            )
+            return None
+
+    def populate(self, zone, target=False, lenient=False):
+        """Populate the zone with data."""
+        self.log.debug(
+            "populate: name=%s, target=%s, lenient=%s",
+            zone.name,
+            target,
+            lenient,
+        )
+
+        trusted = target and self.trusted_populate
+        validators = self._trusted_validators(zone) if trusted else None
+        before = len(zone.records)
+        for name, _type, data in self._zone_data(self.zone_records(zone)):
+            if trusted:
+                record = self._trusted_record(
+                    zone, name, _type, data, validators
                 )
-                zone.add_record(record, lenient=lenient)
+                if record is not None:
+                    zone.add_record(record, lenient=True)
+                continue
+            record = Record.new(zone, name, data, source=self, lenient=lenient)
+            zone.add_record(record, lenient=lenient)
 
         exists = zone.name in self._zone_records
         self.log.info(
@@ -610,6 +1002,55 @@ class BunnyDNSProvider(BaseProvider):
         )
         return exists
 
+    def _bunnydns_fingerprint(self, bunnydns):
+        """
+        Canonical, order-independent form of a record's bunnydns settings.
+
+        Only what ends up in the API request bodies is considered: weight,
+        monitor and the smart routing coordinates count only when smart
+        routing is enabled. Advanced entries equal to the defaults are left
+        out, so they match records with no entry for the value at all.
+        """
+        accelerated = bool(bunnydns.get(OCTODNS_FIELD_ACCELERATED, False))
+        smart_routing = bunnydns.get(
+            OCTODNS_FIELD_SMART_ROUTING, OCTODNS_ROUTING_NONE
+        )
+        advanced = bunnydns.get(OCTODNS_FIELD_ADVANCED) or {}
+        if not self._is_dict(advanced):
+            advanced = {}
+        default = self._advanced_entry_fingerprint({}, smart_routing)
+        entries = []
+        for value, value_entries in advanced.items():
+            for entry in value_entries or []:
+                if not self._is_dict(entry):
+                    entry = {}
+                fingerprint = self._advanced_entry_fingerprint(
+                    entry, smart_routing
+                )
+                if fingerprint != default:
+                    entries.append((str(value), fingerprint))
+        # Sorting on repr() never fails on mixed types and is deterministic
+        return (accelerated, smart_routing, tuple(sorted(entries, key=repr)))
+
+    def _advanced_entry_fingerprint(self, entry, smart_routing):
+        fingerprint = (bool(entry.get(OCTODNS_FIELD_DISABLED, False)),)
+        if smart_routing == OCTODNS_ROUTING_NONE:
+            return fingerprint
+        # With smart routing enabled, the weight should not be 0
+        # (if you want to set weight 0, disable the record instead)
+        fingerprint += (
+            entry.get(OCTODNS_FIELD_WEIGHT) or DEFAULT_SMART_WEIGHT,
+            entry.get(OCTODNS_FIELD_MONITOR, OCTODNS_MONITOR_NONE),
+        )
+        if smart_routing == OCTODNS_ROUTING_LATENCY:
+            fingerprint += (entry.get(OCTODNS_FIELD_LATENCY_ZONE) or '',)
+        elif smart_routing == OCTODNS_ROUTING_GEO:
+            fingerprint += (
+                entry.get(OCTODNS_FIELD_LATITUDE) or 0,
+                entry.get(OCTODNS_FIELD_LONGITUDE) or 0,
+            )
+        return fingerprint
+
     def _extra_changes(self, existing, desired, changes):
         extra_changes = []
         existing_records = {r: r for r in existing.records}
@@ -620,20 +1061,10 @@ class BunnyDNSProvider(BaseProvider):
                 continue
             if desired_record in changed_records:  # Already being updated
                 continue
-            existing_bunnydns = existing_record.octodns.get(
-                OCTODNS_FIELD_BUNNYDNS, {}
-            )
-            desired_bunnydns = desired_record.octodns.get(
-                OCTODNS_FIELD_BUNNYDNS, {}
-            )
-            if (
-                self._disabled_has_changed(existing_bunnydns, desired_bunnydns)
-                or self._accelerated_has_changed(
-                    existing_bunnydns, desired_bunnydns
-                )
-                or self._smart_routing_has_changed(
-                    existing_bunnydns, desired_bunnydns
-                )
+            if self._bunnydns_fingerprint(
+                existing_record.octodns.get(OCTODNS_FIELD_BUNNYDNS, {})
+            ) != self._bunnydns_fingerprint(
+                desired_record.octodns.get(OCTODNS_FIELD_BUNNYDNS, {})
             ):
                 # something has changed in the bunnydns attributes, let's update the record
                 extra_changes.append(Update(existing_record, desired_record))
@@ -646,98 +1077,214 @@ class BunnyDNSProvider(BaseProvider):
         # so let's check if it has a `get` method
         return callable(getattr(potential_dict, "get", None))
 
-    def _field_has_changed(self, existing, desired, fieldname, defaultvalue):
-        existing_advanced = existing.get(OCTODNS_FIELD_ADVANCED, {})
-        desired_advanced = desired.get(OCTODNS_FIELD_ADVANCED, {})
-        existing_disabled = []
-        desired_disabled = []
-        for item in existing_advanced:
-            for entry in existing_advanced[item]:
-                existing_disabled.append(
-                    (item, entry.get(fieldname, defaultvalue))
+    def _record_key(self, params):
+        """Key matching a record body to the record listed in the zone."""
+        return (
+            params['Name'],
+            params['Type'],
+            str(params['Value']).rstrip('.'),
+        )
+
+    def _add_record(self, domain, params, journal=None, blocking=False):
+        """
+        Add a record, return its body if it still has to be confirmed.
+
+        Accelerated records are only submitted when
+        `accelerated_create_timeout` is set (and not `blocking`), a timed out
+        create is confirmed later on by `_confirm_pending_creates`.
+        """
+        digest = body_hash(params)
+        if journal is not None:
+            record_id = journal.completed(JOURNAL_CREATE, digest)
+            if record_id is not None:
+                self.log.debug(
+                    "_add_record:   %s %s created by a previous attempt "
+                    "(record %s), skipping",
+                    params['Type'],
+                    params['Name'],
+                    record_id,
                 )
-        for item in desired_advanced:
-            for entry in desired_advanced[item]:
-                desired_disabled.append(
-                    (item, entry.get(fieldname, defaultvalue))
+                return None
+        body = dict(params)
+        if (
+            blocking
+            or self.accelerated_create_timeout is None
+            or not params.get('Accelerated')
+        ):
+            created = self._client.add_record(
+                domain=domain, params=params, deadline=self._deadline
+            )
+        else:
+            try:
+                created = self._client.add_record(
+                    domain=domain,
+                    params=params,
+                    timeout=self.accelerated_create_timeout,
+                    deadline=self._deadline,
                 )
-        return existing_disabled != desired_disabled
-
-    def _disabled_has_changed(self, existing, desired):
-        return self._field_has_changed(
-            existing, desired, OCTODNS_FIELD_DISABLED, False
-        )
+            except BunnyDNSClientAPIExceptionTimeout:
+                self.log.debug(
+                    "_add_record:   accelerated %s %s submitted, pending",
+                    body['Type'],
+                    body['Name'],
+                )
+                return body
+        if journal is not None:
+            journal.record(JOURNAL_CREATE, digest, record_id=created.get('Id'))
+        return None
 
-    def _weight_has_changed(self, existing, desired):
-        return self._field_has_changed(
-            existing, desired, OCTODNS_FIELD_WEIGHT, 0
-        )
+    def _confirm_pending_creates(self, domain, pending, journal=None):
+        """
+        Wait for timed out creates to show up in the zone.
 
-    def _monitor_has_changed(self, existing, desired):
-        return self._field_has_changed(
-            existing, desired, OCTODNS_FIELD_MONITOR, OCTODNS_MONITOR_NONE
-        )
+        The records still missing after `accelerated_confirm_timeout` are
+        created once more, this time waiting for the API to finish (with the
+        default timeout). A create that can't be confirmed raises.
 
-    def _smart_routing_has_changed(self, existing, desired):
-        existing_smart_routing = existing.get(
-            OCTODNS_FIELD_SMART_ROUTING, OCTODNS_ROUTING_NONE
-        )
-        desired_smart_routing = desired.get(
-            OCTODNS_FIELD_SMART_ROUTING, OCTODNS_ROUTING_NONE
-        )
-        if existing_smart_routing != desired_smart_routing:
-            return True
-        if desired_smart_routing == OCTODNS_ROUTING_NONE:
-            return False
-        # now we know that smart routing is enabled, weight should not be 0
-        # (if you want to set weight 0, disable the record instead)
-        # check for any occurences of weight == 0 and replace it with weight == 100
-        for item in desired.get(OCTODNS_FIELD_ADVANCED, {}):
-            for entry in desired.get(OCTODNS_FIELD_ADVANCED, {})[item]:
-                if not entry.get(OCTODNS_FIELD_WEIGHT):
-                    entry[OCTODNS_FIELD_WEIGHT] = DEFAULT_SMART_WEIGHT
-        if self._weight_has_changed(
-            existing, desired
-        ) or self._monitor_has_changed(existing, desired):
-            return True
-        if existing_smart_routing == OCTODNS_ROUTING_LATENCY:  # latency
-            # compare LatencyZone
-            return self._field_has_changed(
-                existing, desired, OCTODNS_FIELD_LATENCY_ZONE, False
+        With a deadline, the polling stops early enough to send the missing
+        creates again before it, or the apply stops with
+        BunnyDNSProviderDeadlineExceeded when there's no time left for them.
+        """
+        deadline = time.monotonic() + self.accelerated_confirm_timeout
+        if self._deadline is not None:
+            deadline = min(
+                deadline, self._deadline - self._confirm_estimate(pending)
+            )
+        while True:
+            found = defaultdict(list)
+            try:
+                records = self._client.lookup_domain_records(
+                    domain, deadline=self._deadline
+                )
+            except BunnyDNSClientAPIExceptionDeadline as exc:
+                raise BunnyDNSProviderDeadlineExceeded(
+                    f"{domain}: {len(pending)} accelerated creates not "
+                    "confirmed yet, no time left to look them up"
+                ) from exc
+            for record in records:
+                found[self._record_key(record)].append(record['Id'])
+            missing = []
+            for params in pending:
+                key = self._record_key(params)
+                if found[key]:
+                    record_id = found[key].pop()
+                    if journal is not None:
+                        journal.record(
+                            JOURNAL_CREATE,
+                            body_hash(params),
+                            record_id=record_id,
+                        )
+                else:
+                    missing.append(params)
+            self.log.debug(
+                "_confirm_pending_creates:   %d of %d pending creates confirmed",
+                len(pending) - len(missing),
+                len(pending),
             )
-        if existing_smart_routing == OCTODNS_ROUTING_GEO:  # geo
-            # compare lat/lng
-            return self._field_has_changed(
-                existing, desired, OCTODNS_FIELD_LATITUDE, False
-            ) or self._field_has_changed(
-                existing, desired, OCTODNS_FIELD_LONGITUDE, False
+            # `missing` comes from the zone as just listed, a create landing
+            # from now on until it's sent again may still be duplicated
+            if not missing or time.monotonic() >= deadline:
+                break
+            pending = missing
+            time.sleep(
+                min(
+                    self.accelerated_poll_interval,
+                    max(0, deadline - time.monotonic()),
+                )
             )
-        return False
 
-    def _accelerated_has_changed(self, existing, desired):
-        existing_accelerated = existing.get(OCTODNS_FIELD_ACCELERATED, False)
-        desired_accelerated = desired.get(OCTODNS_FIELD_ACCELERATED, False)
-        return existing_accelerated != desired_accelerated
-
-    def _apply_Create(self, change):
-        """Apply the create operations."""
-        new = change.new
-        _class_method = new._type.replace('BunnyDNSProvider/', '')
+        if missing and self._deadline is not None:
+            remaining = self._deadline - time.monotonic()
+            estimate = len(missing) * (self._client.latency or 0)
+            if remaining <= 0 or remaining < estimate:
+                raise BunnyDNSProviderDeadlineExceeded(
+                    f"{domain}: {len(missing)} accelerated creates not "
+                    f"confirmed yet, {max(remaining, 0):.1f}s left, sending "
+                    f"them again would take about {estimate:.1f}s"
+                )
+        for params in missing:
+            self.log.warning(
+                "_confirm_pending_creates: %s %s not created yet, retrying",
+                params['Type'],
+                params['Name'],
+            )
+            try:
+                self._add_record(
+                    domain=domain, params=params, journal=journal, blocking=True
+                )
+            except BunnyDNSClientAPIExceptionTimeout as exc:
+                raise BunnyDNSProviderException(
+                    f"Creating the accelerated {params['Type']} record "
+                    f"{params['Name']!r} could not be confirmed: {exc}"
+                ) from exc
+
+    def _confirm_estimate(self, pending):
+        """About how long confirming the pending creates takes at least."""
+        if not pending:
+            return 0
+        # A zone lookup, and a create for every record not there yet
+        return (1 + len(pending)) * (self._client.latency or 0)
+
+    def _bodies_for(self, record):
+        """Build the API request bodies creating the record."""
+        _class_method = record._type.replace('BunnyDNSProvider/', '')
         params_for = getattr(self, f"_params_for_{_class_method}")
-        for params in params_for(new):
+        bodies = []
+        for params in params_for(record):
             params['Type'] = params['Type'].replace('BunnyDNSProvider/', '')
-            self._client.add_record(domain=new.zone.name[:-1], params=params)
+            bodies.append(params)
+        return bodies
 
-    def _apply_Update(self, change):
-        """Apply the update operations."""
+    def _preflight(self, changes):
+        """
+        Build the request bodies of all the changes before applying any.
+
+        Every problem found is reported at once, so an invalid plan fails
+        before the first mutation instead of leaving the zone half-applied.
+
+        :return: the bodies by change, to be reused by the `_apply_*` methods
+        """
+        bodies = {}
+        errors = []
+        for change in changes:
+            if change.new is None:  # Delete, nothing to build
+                continue
+            try:
+                bodies[id(change)] = self._bodies_for(change.new)
+            except BunnyDNSProviderException as exc:
+                errors.append(f"{change.new.fqdn} ({change.new._type}): {exc}")
+        if errors:
+            raise BunnyDNSProviderException(
+                "Preflight failed, nothing was applied:\n  "
+                + "\n  ".join(errors)
+            )
+        return bodies
+
+    def _apply_Create(self, change, bodies=None, journal=None):
+        """Apply the create operations, return the creates to confirm."""
+        new = change.new
+        if bodies is None:
+            bodies = self._bodies_for(new)
+        pending = []
+        for params in bodies:
+            body = self._add_record(
+                domain=new.zone.name[:-1], params=params, journal=journal
+            )
+            if body is not None:
+                pending.append(body)
+        return pending
+
+    def _apply_Update(self, change, bodies=None, journal=None):
+        """Apply the update operations, return the creates to confirm."""
         # TODO(rzajic): Replace with a proper Update logic
         # for example, the "Accelerated" value cannot be switched off by this delete/create sequence
         # that is probably a BunnyDNS bug, but whatever
-        self._apply_Delete(change)
-        self._apply_Create(change)
+        self._apply_Delete(change, journal=journal)
+        return self._apply_Create(change, bodies=bodies, journal=journal)
 
-    def _apply_Delete(self, change):
-        """Apply the delete operations."""
+    # pylint: disable=unused-argument
+    def _apply_Delete(self, change, bodies=None, journal=None):
+        """Apply the delete operations (deletes have no request bodies)."""
         existing = change.existing
         zone = existing.zone
         for record in self.zone_records(zone):
@@ -745,36 +1292,247 @@ class BunnyDNSProvider(BaseProvider):
                 existing.name == record["Name"]
                 and existing._type == record["Type"]
             ):
+                # The records come from the zone, a record deleted by a
+                # previous attempt isn't there anymore
+                if journal is not None and journal.created(record["Id"]):
+                    # Created by a previous attempt of this Update, its
+                    # create is skipped as well
+                    self.log.debug(
+                        "_apply_Delete:   record %s created by a previous "
+                        "attempt, keeping it",
+                        record["Id"],
+                    )
+                    continue
+                key = str(record["Id"])
                 self._client.delete_record(
-                    domain=zone.name[:-1], record_id=record["Id"]
+                    domain=zone.name[:-1],
+                    record_id=record["Id"],
+                    deadline=self._deadline,
+                )
+                if journal is not None:
+                    journal.record(JOURNAL_DELETE, key, record_id=record["Id"])
+
+    def apply_many(self, plans, max_workers=8):
+        """
+        Apply the plans of many zones concurrently.
+
+        Every plan is applied by a single worker, in the usual change order.
+        At most `max_workers` zones are applied at once, and the API requests
+        of all of them share the client's adaptive concurrency limit. A failed
+        zone doesn't stop the others.
+
+        :return: a dict of ZoneApplyResult by zone name
+        """
+        plans = [plan for plan in plans if plan is not None]
+        self.log.debug(
+            "apply_many: len(plans)=%d, max_workers=%d", len(plans), max_workers
+        )
+
+        def apply(plan):
+            started = time.monotonic()
+            result = ZoneApplyResult(plan.desired.name)
+            try:
+                result.applied = self.apply(plan)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self.log.error(
+                    "apply_many:   %s failed, %s", plan.desired.name, exc
                 )
+                result.error = exc
+            result.elapsed = time.monotonic() - started
+            return result
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for result in executor.map(apply, plans):
+                results[result.zone_name] = result
+        self.log.info(
+            "apply_many: %d zones applied, %d failed",
+            sum(1 for r in results.values() if r.ok),
+            sum(1 for r in results.values() if not r.ok),
+        )
+        return results
+
+    def _check_snapshot(self, zone_name):
+        """
+        Make sure a zone planned from a snapshot hasn't changed since.
+
+        Snapshots older than `snapshot_max_age` are replaced by the live
+        records of the zone before applying it, the plan is refused if
+        they differ (planning the zone again uses the live records).
+        """
+        fetched = self._zone_snapshots.pop(zone_name, None)
+        if fetched is None:
+            return
+        age = time.time() - fetched
+        if age <= self.snapshot_max_age:
+            return
+        self.log.debug(
+            "_check_snapshot:   %s snapshot is %.0fs old, fetching it",
+            zone_name,
+            age,
+        )
+        snapshot = self._zone_records.pop(zone_name, [])
+        live = self._transform_records(
+            self._client.lookup_domain_records(
+                zone_name[:-1], deadline=self._deadline
+            )
+        )
+        self._zone_records[zone_name] = live
+        if self._content_hash(live) != self._content_hash(snapshot):
+            raise BunnyDNSProviderException(
+                f"{zone_name} changed since its snapshot was taken "
+                f"({age:.0f}s ago), plan it again"
+            )
+
+    def start_run(self):
+        """
+        Start a new run, e.g. a new cycle of a long-running process.
+
+        The `time_budget` of the new run is counted from its first plan()
+        or apply().
+        """
+        self._run_started = False
+        if self.time_budget is not None:
+            self._deadline = None
+
+    def _start_deadline(self):
+        """Start counting the time budget, once per run."""
+        if self._run_started:
+            return
+        self._run_started = True
+        if self.time_budget is not None:
+            self._deadline = time.monotonic() + self.time_budget
+
+    def set_deadline(self, deadline):
+        """
+        Set the deadline (a `time.monotonic()` timestamp) of the run.
+
+        API requests made while applying are clamped to the time left, and
+        no change is started once the time left can't cover it. None
+        removes the deadline.
+        """
+        self._deadline = deadline
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def _check_deadline(self, change, bodies, done, total, pending=()):
+        """
+        Refuse to start a change that can't finish before the deadline.
+
+        The time to confirm the `pending` accelerated creates, and the ones
+        the change may add, is kept in reserve.
+        """
+        if self._deadline is None:
+            return
+        requests = len(bodies or [])
+        if change.existing is not None:
+            requests += sum(
+                1
+                for record in self.zone_records(change.existing.zone)
+                if record["Name"] == change.existing.name
+                and record["Type"] == change.existing._type
+            )
+        pending = list(pending)
+        if self.accelerated_create_timeout is not None:
+            pending.extend(
+                params for params in bodies or [] if params.get('Accelerated')
+            )
+        estimate = requests * (self._client.latency or 0)
+        estimate += self._confirm_estimate(pending)
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0 or remaining < estimate:
+            raise BunnyDNSProviderDeadlineExceeded(
+                f"{change.record.zone.name}: {done} of {total} changes "
+                f"applied, {max(remaining, 0):.1f}s left, the next change "
+                f"would take about {estimate:.1f}s"
+            )
 
     def _change_keyer(self, change):
         return (change.CLASS_ORDERING, change.record.name, change.record._type)
 
     def _apply(self, plan):
         """Apply the changes."""
+        self._start_deadline()
         desired = plan.desired
         changes = plan.changes
         self.log.debug(
             "_apply: zone=%s, len(changes)=%d", desired.name, len(changes)
         )
 
+        # Force the operation order to be Delete() -> Create() -> Update()
+        # This will help avoid problems in updating a CNAME record into an
+        # A record and vice-versa
+        changes.sort(key=self._change_keyer)
+
+        self._check_snapshot(desired.name)
+        bodies = self._preflight(changes)
+
         domain_name = desired.name[:-1]
         try:
-            self._client.get_domain(domain=domain_name)
+            self._client.get_domain(domain=domain_name, deadline=self._deadline)
         except BunnyDNSClientAPIExceptionDomainNotFound:
             self.log.debug("_apply:   no matching zone, creating domain")
-            self._client.add_zone(domain_name)
+            self._client.add_zone(domain_name, deadline=self._deadline)
 
-        # Force the operation order to be Delete() -> Create() -> Update()
-        # This will help avoid problems in updating a CNAME record into an
-        # A record and vice-versa
-        changes.sort(key=self._change_keyer)
+        journal = None
+        if self.journal_dir is not None:
+            journal = ChangeJournal(
+                self.journal_dir, desired.name, desired_key(desired)
+            )
+            if journal.resumed_steps:
+                # Only the creates whose records are in the zone are skipped
+                resumed = journal.resumed_steps
+                dropped = journal.verify(
+                    record["Id"]
+                    for record in self._client.lookup_domain_records(
+                        domain_name, deadline=self._deadline
+                    )
+                )
+                self.log.info(
+                    "_apply:   resuming, %d of %d journaled creates confirmed",
+                    resumed - dropped,
+                    resumed,
+                )
 
-        for change in changes:
-            class_name = change.__class__.__name__
-            getattr(self, f"_apply_{class_name}")(change)
+        try:
+            pending = []
+            for done, change in enumerate(changes):
+                try:
+                    self._check_deadline(
+                        change,
+                        bodies.get(id(change)),
+                        done,
+                        len(changes),
+                        pending=pending,
+                    )
+                except BunnyDNSProviderDeadlineExceeded:
+                    # Stop at this change boundary, once the creates already
+                    # submitted are confirmed
+                    if pending:
+                        self._confirm_pending_creates(
+                            domain_name, pending, journal=journal
+                        )
+                    raise
+                class_name = change.__class__.__name__
+                pending.extend(
+                    getattr(self, f"_apply_{class_name}")(
+                        change, bodies=bodies.get(id(change)), journal=journal
+                    )
+                    or []
+                )
+
+            # Clear out the cache if any
+            self._zone_records.pop(desired.name, None)
 
-        # Clear out the cache if any
-        self._zone_records.pop(desired.name, None)
+            if pending:
+                self._confirm_pending_creates(
+                    domain_name, pending, journal=journal
+                )
+        except BaseException:
+            # The zone was (partially) changed, the cached records are stale
+            self._zone_records.pop(desired.name, None)
+            if journal is not None:
+                journal.close()
+            raise
+        if journal is not None:
+            journal.complete()
@@ -1,11 +1,23 @@
 """Custom BunnyDNSProvider records."""
 
-from octodns.equality import EqualityTupleMixin
+from functools import total_ordering
+
 from octodns.record import Record, ValuesMixin
 
 
-class _BunnyDNSPullZoneValue(EqualityTupleMixin, dict):
-    """Class covering the PULLZONE record value."""
+@total_ordering
+class _BunnyDNSValue:
+    """
+    Immutable value of the custom BunnyDNS record types.
+
+    Slotted and hashed once, the values cost about as much as a tuple and
+    compare (mostly) by their cached hash.
+    """
+
+    # pylint can't see the slots set through object.__setattr__
+    # pylint: disable=no-member
+    __slots__ = ('value', '_hash')
+    _type = None
 
     @classmethod
     def validate(cls, data, _type):
@@ -18,89 +30,74 @@ class _BunnyDNSPullZoneValue(EqualityTupleMixin, dict):
     @classmethod
     def process(cls, values):
         """Process multiple values."""
-        return [_BunnyDNSPullZoneValue(v) for v in values]
+        return [cls(v) for v in values]
 
     def __init__(self, value):
         """Initialize the class."""
-        self.value = value
-        self._type = 'PULLZONE'
-
-    def __hash__(self):
-        """Return a hash of the class."""
-        return hash((self._type, self.value))
-
-    def _equality_tuple(self):
-        """Return a tuple to check for equality."""
-        return (self._type, self.value)
-
-    def __repr__(self):
-        return f'{self.value}'
+        if isinstance(value, _BunnyDNSValue):
+            value = value.value
+        object.__setattr__(self, 'value', value)
+        object.__setattr__(self, '_hash', hash((self._type, value)))
 
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
 
-class _BunnyDNSScriptValue(EqualityTupleMixin, dict):
-    """Class covering the SCRIPT record value."""
-
-    @classmethod
-    def validate(cls, data, _type):
-        """Basic validation."""
-        reasons = []
-        if len(data) != 1:
-            reasons.append('Only one value is allowed')
-        return reasons
-
-    @classmethod
-    def process(cls, values):
-        """Process multiple values."""
-        return [_BunnyDNSScriptValue(v) for v in values]
+    def __delattr__(self, name):
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
 
-    def __init__(self, value):
-        """Initialize the class."""
-        self.value = value
-        self._type = 'SCRIPT'
+    def __reduce__(self):
+        return (self.__class__, (self.value,))
 
     def __hash__(self):
-        """Return a hash of the class."""
-        return hash((self._type, self.value))
+        """Return the (cached) hash of the value."""
+        return self._hash
 
     def _equality_tuple(self):
         """Return a tuple to check for equality."""
         return (self._type, self.value)
 
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, _BunnyDNSValue):
+            return NotImplemented
+        return self._hash == other._hash and (
+            self._equality_tuple() == other._equality_tuple()
+        )
+
+    def __lt__(self, other):
+        if not isinstance(other, _BunnyDNSValue):
+            return NotImplemented
+        return self._equality_tuple() < other._equality_tuple()
+
+    @property
+    def data(self):
+        """The value, as found in the record data."""
+        return self.value
+
     def __repr__(self):
         return f'{self.value}'
 
 
-class _BunnyDNSRedirectValue(EqualityTupleMixin, dict):
-    """Class covering the REDIRECT record value."""
+class _BunnyDNSPullZoneValue(_BunnyDNSValue):
+    """Class covering the PULLZONE record value."""
 
-    @classmethod
-    def validate(cls, data, _type):
-        """Basic validation."""
-        reasons = []
-        if len(data) != 1:
-            reasons.append('Only one value is allowed')
-        return reasons
+    __slots__ = ()
+    _type = 'PULLZONE'
 
-    @classmethod
-    def process(cls, values):
-        """Process multiple values."""
-        return [_BunnyDNSRedirectValue(v) for v in values]
 
-    def __init__(self, value):
-        """Initialize the class."""
-        self.value = value
-        self._type = 'REDIRECT'
+class _BunnyDNSScriptValue(_BunnyDNSValue):
+    """Class covering the SCRIPT record value."""
 
-    def __hash__(self):
-        """Return a hash of the class."""
-        return hash((self._type, self.value))
+    __slots__ = ()
+    _type = 'SCRIPT'
 
-    def _equality_tuple(self):
-        """Return a tuple to check for equality."""
-        return (self._type, self.value)
 
-    def __repr__(self):
-        return f'{self.value}'
+class _BunnyDNSRedirectValue(_BunnyDNSValue):
+    """Class covering the REDIRECT record value."""
+
+    __slots__ = ()
+    _type = 'REDIRECT'
 
 
 class BunnyDNSPullZoneRecord(ValuesMixin, Record):
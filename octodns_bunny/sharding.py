@@ -0,0 +1,75 @@
+"""Deterministic split of the BunnyDNS zones across sync nodes."""
+
+import hashlib
+
+# How much more than its even share of the load a shard may take before
+# zones overflow to their next preferred shard
+LOAD_SLACK = 1.25
+
+
+def _score(domain, shard):
+    digest = hashlib.sha256(f'{domain}/{shard}'.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+
+def shard_order(domain, shard_count):
+    """
+    The shards of a zone, by preference (rendezvous hashing).
+
+    The order only depends on the zone name, and adding a shard only moves
+    the zones preferring the new one.
+    """
+    domain = domain.rstrip('.')
+    return sorted(
+        range(shard_count),
+        key=lambda shard: _score(domain, shard),
+        reverse=True,
+    )
+
+
+def hash_shard(domain, shard_count):
+    """The shard of a zone missing from the listing (e.g. a new zone)."""
+    return shard_order(domain, shard_count)[0]
+
+
+def zone_weight(zone):
+    """
+    The API load of a listed zone: its record count, rounded down to a power
+    of two so that the usual record churn doesn't change it.
+    """
+    count = max(1, len(zone.get('Records') or []))
+    return 1 << (count.bit_length() - 1)
+
+
+def assign_shards(zones, shard_count):
+    """
+    Split the listed zones into `shard_count` shards of similar API load.
+
+    Every zone goes to its most preferred shard (see `shard_order`) that can
+    take its weight without exceeding `LOAD_SLACK` times the even share of
+    the load, heaviest zones first, or else to its least loaded shard. The
+    zones thus mostly stay on their own shard as the listing changes, and
+    every node gets the same split from the same listing.
+
+    :param zones: the zones, as returned by `BunnyDNSClient.list_zones`
+    :return: a dict of shard index by domain
+    """
+    weighted = sorted(
+        ((zone_weight(zone), zone['Domain']) for zone in zones),
+        key=lambda item: (-item[0], item[1]),
+    )
+    if not weighted:
+        return {}
+    total = sum(weight for weight, _ in weighted)
+    capacity = max(LOAD_SLACK * total / shard_count, weighted[0][0])
+    loads = [0] * shard_count
+    assignment = {}
+    for weight, domain in weighted:
+        order = shard_order(domain, shard_count)
+        shard = next(
+            (s for s in order if loads[s] + weight <= capacity),
+            min(order, key=loads.__getitem__),
+        )
+        assignment[domain] = shard
+        loads[shard] += weight
+    return assignment
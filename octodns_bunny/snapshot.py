@@ -0,0 +1,46 @@
+"""On-disk snapshots of the BunnyDNS zone records, for offline planning."""
+
+import json
+import os
+import time
+
+
+def snapshot_path(directory, zone_name):
+    """The snapshot file of a zone (the name with or without the dot)."""
+    return os.path.join(directory, f"{zone_name.rstrip('.')}.snapshot.json")
+
+
+def write_snapshot(directory, domain, records, date_modified=None):
+    """
+    Write the records of a zone, as `lookup_domain_records` returns them.
+
+    The file is replaced atomically, a reader never sees a partial one.
+    """
+    path = snapshot_path(directory, domain)
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as fh:
+        json.dump(
+            {
+                'Domain': domain,
+                'DateModified': date_modified,
+                'Fetched': time.time(),
+                'Records': records,
+            },
+            fh,
+        )
+    os.replace(tmp, path)
+    return path
+
+
+def read_snapshot(directory, zone_name):
+    """
+    Read the snapshot of a zone.
+
+    :return: the snapshot (with its `Records` and `Fetched` timestamp), or
+             None when there is no snapshot of the zone
+    """
+    try:
+        with open(snapshot_path(directory, zone_name), encoding='utf-8') as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return None
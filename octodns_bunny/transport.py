@@ -0,0 +1,260 @@
+"""
+HTTP transports used by the BunnyDNS client.
+
+The HTTP libraries are imported when a transport is built, not when this
+module is imported, which keeps importing the provider cheap.
+
+`RecordingTransport` and `ReplayTransport` record the API exchanges of a
+session to a file and replay them offline, for reproducible benchmarks.
+"""
+
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from urllib.parse import urlencode, urlsplit
+
+# pylint: disable=import-outside-toplevel
+TRANSPORT_REQUESTS = 'requests'
+TRANSPORT_HTTP2 = 'http2'
+
+
+class TransportResponse:
+    """A transport independent HTTP response."""
+
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+
+    @property
+    def text(self):
+        """The response body as text."""
+        return self.content.decode('utf-8', errors='replace')
+
+
+class RequestsTransport:
+    """HTTP/1.1 transport built on a `requests.Session` (the default)."""
+
+    def __init__(self, headers):
+        from requests import Request, Session
+        from requests.exceptions import Timeout
+
+        self._request_class = Request
+        self._session = Session()
+        self._session.headers.update(headers)
+        # Raised by send() when the request timed out
+        self.timeout_error = Timeout
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def send(self, method, url, headers, body, params, timeout):
+        """Send a request, return a TransportResponse."""
+        prepared = self._session.prepare_request(
+            self._request_class(
+                method, url, data=body, headers=headers, params=params
+            )
+        )
+        response = self._session.send(prepared, timeout=timeout)
+        return TransportResponse(response.status_code, response.content)
+
+
+class HTTP2Transport:
+    """
+    HTTP/2 transport built on `httpx`.
+
+    All concurrent requests are multiplexed over a single connection.
+    Transport errors are raised as their `requests` counterparts, so the
+    client maps them exactly like the ones of the default transport.
+    """
+
+    def __init__(self, headers):
+        try:
+            import httpx
+        except ImportError as exc:
+            raise ImportError(
+                'The http2 transport requires httpx[http2], '
+                'install octodns-bunny[http2]'
+            ) from exc
+        from requests import exceptions
+
+        self._httpx = httpx
+        self._client = httpx.Client(http2=True, headers=headers)
+        self._connection_error = exceptions.ConnectionError
+        # Raised by send() when the request timed out
+        self.timeout_error = exceptions.Timeout
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def send(self, method, url, headers, body, params, timeout):
+        """Send a request, return a TransportResponse."""
+        try:
+            response = self._client.request(
+                method,
+                url,
+                content=body,
+                headers=headers,
+                params=params,
+                timeout=timeout,
+            )
+        except self._httpx.TimeoutException as exc:
+            raise self.timeout_error(str(exc)) from exc
+        except self._httpx.TransportError as exc:
+            raise self._connection_error(str(exc)) from exc
+        return TransportResponse(response.status_code, response.content)
+
+
+# Never written to a recording
+REDACTED_HEADERS = frozenset(('accesskey', 'authorization'))
+
+
+def exchange_key(method, url, params, body):
+    """
+    The key a request is replayed by.
+
+    The API host is left out and JSON bodies are compared canonically, so a
+    recording replays with any `api_url` and JSON codec.
+    """
+    parts = urlsplit(url)
+    if params:
+        query = urlencode(sorted((str(k), str(v)) for k, v in params.items()))
+        path = f'{parts.path}?{query}'
+    else:
+        path = parts.path
+    if body:
+        try:
+            body = json.dumps(json.loads(body), sort_keys=True)
+        except ValueError:
+            pass
+    return f'{method} {path} {body or ""}'
+
+
+class RecordingTransport:
+    """
+    Record the exchanges of another transport to a JSON lines file.
+
+    Every request (without the redacted headers) is appended along with its
+    response (or timeout) and latency.
+    """
+
+    def __init__(self, transport, filename):
+        self._transport = transport
+        self._lock = threading.Lock()
+        # pylint: disable=consider-using-with
+        self._fh = open(filename, 'a', encoding='utf-8')
+        self.timeout_error = transport.timeout_error
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def send(self, method, url, headers, body, params, timeout):
+        """Send a request through the wrapped transport, record it."""
+        exchange = {
+            'method': method,
+            'url': url,
+            'params': params,
+            'headers': {
+                k: v
+                for k, v in (headers or {}).items()
+                if k.lower() not in REDACTED_HEADERS
+            },
+            'body': body.decode('utf-8') if isinstance(body, bytes) else body,
+        }
+        started = time.monotonic()
+        try:
+            response = self._transport.send(
+                method, url, headers, body, params, timeout
+            )
+        except self.timeout_error:
+            exchange['timeout'] = True
+            self._write(exchange, started)
+            raise
+        exchange['status_code'] = response.status_code
+        exchange['content'] = response.text
+        self._write(exchange, started)
+        return response
+
+    def _write(self, exchange, started):
+        exchange['latency'] = round(time.monotonic() - started, 6)
+        line = json.dumps(exchange, sort_keys=True)
+        with self._lock:
+            self._fh.write(f'{line}\n')
+            self._fh.flush()
+
+
+class ReplayTransport:
+    """
+    Replay the exchanges recorded by `RecordingTransport`, offline.
+
+    Requests are answered by the recorded responses to the same request, in
+    the order they were recorded. With a `latency_scale`, every response is
+    delayed by its recorded latency times the scale (0 replays instantly).
+    A request that wasn't recorded raises `LookupError`.
+    """
+
+    def __init__(self, filename, latency_scale=0.0):
+        from requests.exceptions import Timeout
+
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self._exchanges = defaultdict(deque)
+        with open(filename, encoding='utf-8') as fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                exchange = json.loads(line)
+                key = exchange_key(
+                    exchange['method'],
+                    exchange['url'],
+                    exchange.get('params'),
+                    exchange.get('body'),
+                )
+                self._exchanges[key].append(exchange)
+        # Raised by send() when the request timed out
+        self.timeout_error = Timeout
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-positional-arguments
+    def send(self, method, url, headers, body, params, timeout):
+        """Answer a request with its recorded response."""
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+        key = exchange_key(method, url, params, body)
+        with self._lock:
+            recorded = self._exchanges.get(key)
+            if not recorded:
+                raise LookupError(f'No recorded exchange for {key}')
+            # The last response is kept, identical reads may repeat
+            exchange = recorded.popleft() if len(recorded) > 1 else recorded[0]
+        if self.latency_scale:
+            time.sleep(exchange['latency'] * self.latency_scale)
+        if exchange.get('timeout'):
+            raise self.timeout_error(f'{method} {url} timed out (recorded)')
+        return TransportResponse(
+            exchange['status_code'], exchange['content'].encode('utf-8')
+        )
+
+
+TRANSPORTS = {
+    TRANSPORT_REQUESTS: RequestsTransport,
+    TRANSPORT_HTTP2: HTTP2Transport,
+}
+
+
+def build_transport(
+    name, headers, record_file=None, replay_file=None, replay_latency=0.0
+):
+    """
+    Build the named transport.
+
+    With `replay_file` the recorded exchanges are replayed instead, with
+    `record_file` the exchanges of the transport are recorded there.
+    """
+    if replay_file is not None:
+        return ReplayTransport(replay_file, latency_scale=replay_latency)
+    try:
+        transport_class = TRANSPORTS[name]
+    except KeyError as exc:
+        raise ValueError(f"Unknown transport: {name}") from exc
+    transport = transport_class(headers)
+    if record_file is not None:
+        transport = RecordingTransport(transport, record_file)
+    return transport
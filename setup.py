@@ -29,6 +29,12 @@ setup(
     author='MyStarInYourSky',
     author_email='',
     description=description,
+    entry_points={
+        'console_scripts': (
+            'octodns-bunny-dump = octodns_bunny.dump:main',
+            'octodns-bunny-reconcile = octodns_bunny.daemon:main',
+        )
+    },
     extras_require={
         'dev': tests_require
         + (
@@ -45,6 +51,8 @@ setup(
             'pylint==3.3.3',
             'setuptools>=75.0.0',
         ),
+        'fast-json': ('orjson>=3.6.0',),
+        'http2': ('httpx[http2]>=0.23.0',),
         'test': tests_require,
     },
     install_requires=('octodns>=0.9.16', 'requests>=2.27.0'),
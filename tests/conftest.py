@@ -0,0 +1,184 @@
+"""Shared fixtures: an in-memory fake of the BunnyDNS API."""
+
+import json
+import re
+from urllib.parse import urlparse
+
+import pytest
+import requests_mock as requests_mock_module
+
+from octodns_bunny import BunnyDNSProvider
+
+API_URL = 'https://api.bunny.test'
+RECORD_TYPES = {
+    'A': 0,
+    'AAAA': 1,
+    'CNAME': 2,
+    'TXT': 3,
+    'MX': 4,
+    'REDIRECT': 5,
+    'PULLZONE': 7,
+    'SRV': 8,
+    'CAA': 9,
+    'PTR': 10,
+    'SCRIPT': 11,
+    'NS': 12,
+}
+# Bunny drops the trailing dot of these record values
+DOTTED_TYPES = (2, 4, 8, 12)
+
+
+class FakeBunnyAPI:
+    """
+    In-memory BunnyDNS API, answering the requests made through requests.
+
+    `hooks` are called with every request before it's answered, a hook may
+    return a response (or raise) to inject failures.
+    """
+
+    def __init__(self):
+        self.zones = {}
+        self.calls = []
+        self.hooks = []
+        self._next_id = 1
+        self._modified = 0
+
+    def _id(self):
+        self._next_id += 1
+        return self._next_id
+
+    def _touch(self, zone):
+        self._modified += 1
+        zone['DateModified'] = f'2024-01-01T00:00:{self._modified:02d}'
+
+    def add_zone(self, domain):
+        """Add a zone, return it."""
+        zone = {'Id': self._id(), 'Domain': domain, 'Records': []}
+        self._touch(zone)
+        self.zones[domain] = zone
+        return zone
+
+    def add_record(self, domain, **fields):
+        """Add a record to a zone (`Type` by name), return it."""
+        fields['Type'] = RECORD_TYPES.get(fields['Type'], fields['Type'])
+        record = {
+            'Id': self._id(),
+            'Ttl': 300,
+            'Value': '',
+            'Name': '',
+            'Weight': 0,
+            'Priority': 0,
+            'Port': 0,
+            'Flags': 0,
+            'Tag': '',
+            'Accelerated': False,
+            'LinkName': '',
+            'MonitorType': 0,
+            'GeolocationLatitude': 0.0,
+            'GeolocationLongitude': 0.0,
+            'LatencyZone': None,
+            'SmartRoutingType': 0,
+            'Disabled': False,
+        }
+        record.update(fields)
+        if record['Type'] in DOTTED_TYPES:
+            record['Value'] = record['Value'].rstrip('.')
+        if record['Type'] == RECORD_TYPES['SCRIPT']:
+            record['Value'] = str(fields.get('ScriptId', record['Value']))
+        if record['Type'] == RECORD_TYPES['PULLZONE']:
+            record['LinkName'] = str(fields.get('PullZoneId', ''))
+        zone = self.zones[domain]
+        zone['Records'].append(record)
+        self._touch(zone)
+        return record
+
+    def records(self, domain):
+        """The records of a zone."""
+        return self.zones[domain]['Records']
+
+    def requests(self, method=None, path=None):
+        """The (method, path) of the requests made, optionally filtered."""
+        return [
+            (m, p)
+            for m, p in self.calls
+            if (method is None or m == method) and (path is None or p == path)
+        ]
+
+    def _zone_by_id(self, zone_id):
+        for zone in self.zones.values():
+            if zone['Id'] == int(zone_id):
+                return zone
+        return None
+
+    def __call__(self, request):
+        """requests_mock matcher."""
+        path = urlparse(request.url).path
+        self.calls.append((request.method, path))
+        for hook in self.hooks:
+            response = hook(request, path)
+            if response is not None:
+                return response
+        return self._handle(request, path)
+
+    def _respond(self, request, status_code, body=None):
+        if body is None:
+            return requests_mock_module.create_response(
+                request, status_code=status_code, content=b''
+            )
+        return requests_mock_module.create_response(
+            request, status_code=status_code, json=body
+        )
+
+    def _handle(self, request, path):
+        method = request.method
+        if method == 'GET' and path == '/dnszone':
+            return self._respond(
+                request,
+                200,
+                {'Items': list(self.zones.values()), 'HasMoreItems': False},
+            )
+        if method == 'POST' and path == '/dnszone':
+            return self._respond(
+                request, 201, self.add_zone(json.loads(request.body)['Domain'])
+            )
+        match = re.fullmatch(r'/dnszone/(\d+)(/records(?:/(\d+))?)?', path)
+        zone = self._zone_by_id(match.group(1)) if match else None
+        if zone is None:
+            return self._respond(request, 404, {})
+        if method == 'GET' and not match.group(2):
+            return self._respond(request, 200, zone)
+        if method == 'PUT' and match.group(2) and not match.group(3):
+            fields = json.loads(request.body)
+            return self._respond(
+                request, 201, self.add_record(zone['Domain'], **fields)
+            )
+        if method == 'DELETE' and match.group(3):
+            record_id = int(match.group(3))
+            before = len(zone['Records'])
+            zone['Records'] = [
+                r for r in zone['Records'] if r['Id'] != record_id
+            ]
+            if len(zone['Records']) == before:
+                return self._respond(request, 404, {})
+            self._touch(zone)
+            return self._respond(request, 204)
+        return self._respond(request, 404, {})
+
+
+@pytest.fixture
+def bunny_api(requests_mock):  # pylint: disable=redefined-outer-name
+    """The fake API, serving all the requests made to `API_URL`."""
+    api = FakeBunnyAPI()
+    requests_mock.add_matcher(api)
+    return api
+
+
+@pytest.fixture
+def make_provider(bunny_api):  # pylint: disable=redefined-outer-name
+    """Build providers talking to the fake API (with their own clients)."""
+
+    def make(**kwargs):
+        kwargs.setdefault('share_client', False)
+        return BunnyDNSProvider('bunny', 'token', api_url=API_URL, **kwargs)
+
+    return make
@@ -0,0 +1,81 @@
+"""Submitting accelerated creates and confirming them later."""
+
+import json
+
+import pytest
+from requests.exceptions import ReadTimeout
+
+from octodns.record import Record
+from octodns.zone import Zone
+
+from octodns_bunny.provider import BunnyDNSProviderException
+
+
+def desired_zone():
+    zone = Zone('example.com.', [])
+    zone.add_record(
+        Record.new(
+            zone,
+            'cdn',
+            {
+                'type': 'CNAME',
+                'ttl': 300,
+                'value': 'origin.example.net.',
+                'octodns': {'bunnydns': {'accelerated': True}},
+            },
+        )
+    )
+    return zone
+
+
+def accelerated_put_timeout(bunny_api, lands=False, times=None):
+    """A hook timing out accelerated creates (optionally creating them)."""
+    state = {'timeouts': 0}
+
+    def hook(request, path):
+        if request.method != 'PUT':
+            return None
+        if times is not None and state['timeouts'] >= times:
+            return None
+        state['timeouts'] += 1
+        if lands:
+            fields = json.loads(request.body)
+            bunny_api.add_record('example.com', **fields)
+        raise ReadTimeout('timed out')
+
+    return hook
+
+
+def make(make_provider):
+    return make_provider(
+        accelerated_create_timeout=1,
+        accelerated_confirm_timeout=0,
+        accelerated_poll_interval=0,
+    )
+
+
+def test_landed_create_is_confirmed(bunny_api, make_provider):
+    bunny_api.add_zone('example.com')
+    bunny_api.hooks.append(accelerated_put_timeout(bunny_api, lands=True))
+    provider = make(make_provider)
+    provider.apply(provider.plan(desired_zone()))
+    assert len(bunny_api.records('example.com')) == 1
+    assert len(bunny_api.requests('PUT')) == 1
+
+
+def test_missing_create_is_sent_again(bunny_api, make_provider):
+    bunny_api.add_zone('example.com')
+    bunny_api.hooks.append(accelerated_put_timeout(bunny_api, times=1))
+    provider = make(make_provider)
+    provider.apply(provider.plan(desired_zone()))
+    assert len(bunny_api.records('example.com')) == 1
+    assert len(bunny_api.requests('PUT')) == 2
+
+
+def test_unconfirmed_create_raises(bunny_api, make_provider):
+    bunny_api.add_zone('example.com')
+    bunny_api.hooks.append(accelerated_put_timeout(bunny_api))
+    provider = make(make_provider)
+    with pytest.raises(BunnyDNSProviderException, match='not be confirmed'):
+        provider.apply(provider.plan(desired_zone()))
+    assert bunny_api.records('example.com') == []
@@ -0,0 +1,69 @@
+"""The circuit breaker of the BunnyDNS client."""
+
+import pytest
+
+from octodns_bunny import circuit_breaker as circuit_breaker_module
+from octodns_bunny.circuit_breaker import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+)
+from octodns_bunny.client_exceptions import (
+    BunnyDNSClientAPIExceptionCircuitOpen,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker_module.time, 'monotonic', clock)
+    return clock
+
+
+def open_breaker(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    # A slow call goes out before the circuit opens
+    straggler = breaker.before_call()
+    for _ in range(2):
+        breaker.record(True, probe=breaker.before_call())
+    assert breaker.state == CIRCUIT_OPEN
+    with pytest.raises(BunnyDNSClientAPIExceptionCircuitOpen):
+        breaker.before_call()
+    clock.now += 30
+    return breaker, straggler
+
+
+@pytest.mark.parametrize('failed', [False, True])
+def test_only_the_probe_decides(clock, failed):
+    breaker, straggler = open_breaker(clock)
+    probe = breaker.before_call()
+    assert probe is True
+    assert breaker.state == CIRCUIT_HALF_OPEN
+
+    # The straggler finishing says nothing about the probe
+    breaker.record(not failed, probe=straggler)
+    assert breaker.state == CIRCUIT_HALF_OPEN
+    with pytest.raises(BunnyDNSClientAPIExceptionCircuitOpen):
+        breaker.before_call()
+
+    breaker.record(failed, probe=probe)
+    assert breaker.state == (CIRCUIT_OPEN if failed else CIRCUIT_CLOSED)
+
+
+def test_neutral_probe_lets_another_probe_through(clock):
+    breaker, _ = open_breaker(clock)
+    breaker.record(None, probe=breaker.before_call())
+    assert breaker.state == CIRCUIT_HALF_OPEN
+    probe = breaker.before_call()
+    assert probe is True
+    breaker.record(False, probe=probe)
+    assert breaker.state == CIRCUIT_CLOSED
@@ -0,0 +1,41 @@
+"""The process-wide shared clients."""
+
+import logging
+
+import pytest
+
+from octodns_bunny import client as client_module
+from octodns_bunny.client import BunnyDNSClient
+from octodns_bunny.transport import ReplayTransport
+
+
+@pytest.fixture(autouse=True)
+def empty_registry(monkeypatch):
+    monkeypatch.setattr(client_module, '_SHARED_CLIENTS', {})
+
+
+def test_same_options_share_the_client():
+    first = BunnyDNSClient.shared('token', max_concurrency=8)
+    assert BunnyDNSClient.shared('token', max_concurrency=8) is first
+    assert BunnyDNSClient.shared('other') is not first
+
+
+def test_replay_never_gets_the_live_client(tmp_path):
+    recording = tmp_path / 'session.jsonl'
+    recording.write_text('')
+    live = BunnyDNSClient.shared('token')
+    replay = BunnyDNSClient.shared('token', replay_file=str(recording))
+    assert replay is not live
+    assert isinstance(replay._transport, ReplayTransport)
+    assert not isinstance(live._transport, ReplayTransport)
+
+
+def test_other_options_are_reported(caplog):
+    first = BunnyDNSClient.shared('token', max_concurrency=8)
+    with caplog.at_level(logging.WARNING, logger='BunnyDNSClient'):
+        second = BunnyDNSClient.shared(
+            'token', max_concurrency=4, circuit_window=10
+        )
+    assert second is first
+    assert 'circuit_window=10 (using 20)' in caplog.text
+    assert 'max_concurrency=4 (using 8)' in caplog.text
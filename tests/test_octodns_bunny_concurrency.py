@@ -0,0 +1,53 @@
+"""The adaptive concurrency limit of the BunnyDNS client."""
+
+import pytest
+
+from octodns_bunny import concurrency as concurrency_module
+from octodns_bunny.client import request_kind
+from octodns_bunny.concurrency import AdaptiveLimiter
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(concurrency_module.time, 'monotonic', clock)
+    return clock
+
+
+def call(limiter, clock, kind, latency):
+    slot = limiter.acquire(kind)
+    clock.now += latency
+    limiter.release(slot)
+
+
+def test_slow_kinds_are_not_spikes(clock):
+    limiter = AdaptiveLimiter(floor=1, ceiling=16, initial=8)
+    for _ in range(5):
+        call(limiter, clock, 'DELETE /dnszone/1/records/*', 0.1)
+    call(limiter, clock, 'PUT /dnszone/1/records accelerated', 5)
+    call(limiter, clock, 'GET /dnszone/2', 2)
+    assert limiter.limit == 8
+
+    call(limiter, clock, 'GET /dnszone/2', 2)
+    call(limiter, clock, 'DELETE /dnszone/1/records/*', 1)
+    assert limiter.limit == 4
+
+
+def test_request_kinds():
+    assert request_kind('GET', '/dnszone/1') != request_kind(
+        'GET', '/dnszone/2'
+    )
+    assert request_kind('DELETE', '/dnszone/1/records/7') == request_kind(
+        'DELETE', '/dnszone/1/records/8'
+    )
+    assert request_kind(
+        'PUT', '/dnszone/1/records', {'Accelerated': True}
+    ) != request_kind('PUT', '/dnszone/1/records', {'Accelerated': False})
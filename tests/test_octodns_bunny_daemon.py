@@ -0,0 +1,82 @@
+"""Reconcile cycles of the long-running daemon."""
+
+from argparse import Namespace
+
+import pytest
+from conftest import API_URL
+
+from octodns.manager import Manager
+
+from octodns_bunny.daemon import reconcile
+
+CONFIG = f'''
+providers:
+  config:
+    class: octodns.provider.yaml.YamlProvider
+    directory: {{directory}}
+  bunny:
+    class: octodns_bunny.BunnyDNSProvider
+    token: token
+    api_url: {API_URL}
+    share_client: false
+zones:
+  example.com.:
+    sources: [config]
+    targets: [bunny]
+  example.org.:
+    sources: [config]
+    targets: [bunny]
+'''
+
+
+@pytest.fixture
+def manager(bunny_api, tmp_path):
+    for domain in ('example.com', 'example.org'):
+        bunny_api.add_zone(domain)
+        bunny_api.add_record(domain, Type='A', Name='www', Value='192.0.2.1')
+        (tmp_path / f'{domain}.yaml').write_text(
+            'www:\n  ttl: 300\n  type: A\n  value: 192.0.2.1\n'
+        )
+    config = tmp_path / 'config.yaml'
+    config.write_text(CONFIG.format(directory=tmp_path))
+    return Manager(str(config))
+
+
+def args():
+    return Namespace(zone=[], source=[], target=[], doit=True, force=True)
+
+
+def zone_downloads(bunny_api, domain):
+    zone_id = bunny_api.zones[domain]['Id']
+    return len(bunny_api.requests('GET', f'/dnszone/{zone_id}'))
+
+
+def test_unchanged_zones_are_not_downloaded_again(bunny_api, manager):
+    assert reconcile(manager, args()) == 0
+    assert zone_downloads(bunny_api, 'example.com') == 1
+    assert zone_downloads(bunny_api, 'example.org') == 1
+
+    for _ in range(2):
+        assert reconcile(manager, args()) == 0
+    assert zone_downloads(bunny_api, 'example.com') == 1
+    assert zone_downloads(bunny_api, 'example.org') == 1
+
+
+def test_modified_zones_are_downloaded_again(bunny_api, manager):
+    assert reconcile(manager, args()) == 0
+
+    # Somebody edits example.com in the dashboard, its DateModified moves
+    bunny_api.add_record(
+        'example.com', Type='A', Name='extra', Value='192.0.2.9'
+    )
+    assert reconcile(manager, args()) == 1
+    # Downloaded again to plan it, then fetched once more by the apply
+    assert zone_downloads(bunny_api, 'example.com') == 3
+    assert zone_downloads(bunny_api, 'example.org') == 1
+    assert [r['Name'] for r in bunny_api.records('example.com')] == ['www']
+
+    # The zone changed by the apply is downloaded once more, then it's cached
+    for _ in range(2):
+        assert reconcile(manager, args()) == 0
+    assert zone_downloads(bunny_api, 'example.com') == 4
+    assert zone_downloads(bunny_api, 'example.org') == 1
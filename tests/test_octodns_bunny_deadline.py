@@ -0,0 +1,129 @@
+"""The time budget of a run."""
+
+import pytest
+from requests.exceptions import ReadTimeout
+
+from octodns.record import Record
+from octodns.zone import Zone
+
+from octodns_bunny import provider as provider_module
+from octodns_bunny.client_exceptions import BunnyDNSClientAPIExceptionDeadline
+from octodns_bunny.provider import BunnyDNSProviderDeadlineExceeded
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(provider_module.time, 'monotonic', clock)
+    return clock
+
+
+def desired_zone():
+    zone = Zone('example.com.', [])
+    zone.add_record(
+        Record.new(zone, 'www', {'type': 'A', 'ttl': 300, 'value': '192.0.2.1'})
+    )
+    return zone
+
+
+def test_budget_is_counted_from_the_first_plan(bunny_api, make_provider, clock):
+    bunny_api.add_zone('example.com')
+    provider = make_provider(time_budget=60)
+    clock.now += 120
+    plan = provider.plan(desired_zone())
+    assert provider._deadline == clock.now + 60
+    provider.apply(plan)
+    assert [r['Name'] for r in bunny_api.records('example.com')] == ['www']
+
+
+def test_every_run_gets_the_full_budget(bunny_api, make_provider, clock):
+    bunny_api.add_zone('example.com')
+    provider = make_provider(time_budget=60)
+    plan = provider.plan(desired_zone())
+    clock.now += 120
+    with pytest.raises(BunnyDNSClientAPIExceptionDeadline):
+        provider.apply(plan)
+
+    provider.start_run()
+    provider.apply(provider.plan(desired_zone()))
+    assert [r['Name'] for r in bunny_api.records('example.com')] == ['www']
+
+
+def accelerated_zone():
+    zone = Zone('example.com.', [])
+    for name in ('cdn', 'www'):
+        zone.add_record(
+            Record.new(
+                zone,
+                name,
+                {
+                    'type': 'CNAME',
+                    'ttl': 300,
+                    'value': 'origin.example.net.',
+                    'octodns': {'bunnydns': {'accelerated': True}},
+                },
+            )
+        )
+    return zone
+
+
+def accelerated_provider(make_provider, monkeypatch, clock):
+    monkeypatch.setattr(
+        provider_module.time,
+        'sleep',
+        lambda seconds: setattr(clock, 'now', clock.now + seconds),
+    )
+    return make_provider(
+        time_budget=60,
+        accelerated_create_timeout=1,
+        accelerated_confirm_timeout=120,
+        accelerated_poll_interval=5,
+    )
+
+
+def put_timeout(clock, advance=0):
+    def hook(request, path):
+        if request.method == 'PUT':
+            clock.now += advance
+            raise ReadTimeout('timed out')
+        return None
+
+    return hook
+
+
+def test_confirming_stops_at_the_deadline(
+    bunny_api, make_provider, monkeypatch, clock
+):
+    bunny_api.add_zone('example.com')
+    provider = accelerated_provider(make_provider, monkeypatch, clock)
+    plan = provider.plan(accelerated_zone())
+    started = clock.now
+    bunny_api.hooks.append(put_timeout(clock))
+    with pytest.raises(BunnyDNSProviderDeadlineExceeded) as ctx:
+        provider.apply(plan)
+    assert '2 accelerated creates not confirmed yet' in str(ctx.value)
+    # The polling was cut short, the creates weren't sent again
+    assert clock.now - started <= 60
+    assert len(bunny_api.requests('PUT')) == 2
+
+
+def test_pending_creates_are_confirmed_at_the_change_boundary(
+    bunny_api, make_provider, monkeypatch, clock
+):
+    bunny_api.add_zone('example.com')
+    provider = accelerated_provider(make_provider, monkeypatch, clock)
+    plan = provider.plan(accelerated_zone())
+    # The first create eats up the whole budget
+    bunny_api.hooks.append(put_timeout(clock, advance=61))
+    with pytest.raises(BunnyDNSProviderDeadlineExceeded) as ctx:
+        provider.apply(plan)
+    assert '1 accelerated creates not confirmed yet' in str(ctx.value)
+    assert len(bunny_api.requests('PUT')) == 1
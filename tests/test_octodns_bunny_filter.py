@@ -0,0 +1,108 @@
+"""The BunnyDNS processors."""
+
+import pytest
+
+from octodns.record import Record
+from octodns.zone import Zone
+
+from octodns_bunny.filter import BunnyDNSNormalizer
+
+RECORDS = {
+    'cname-advanced': (
+        'www',
+        {
+            'type': 'CNAME',
+            'ttl': 300,
+            'value': 'origin.example.net.',
+            'octodns': {
+                'bunnydns': {
+                    'advanced': {'origin.example.net.': [{'disabled': True}]}
+                }
+            },
+        },
+    ),
+    'alias-advanced': (
+        '',
+        {
+            'type': 'ALIAS',
+            'ttl': 300,
+            'value': 'origin.example.net.',
+            'octodns': {
+                'bunnydns': {
+                    'advanced': {'origin.example.net': [{'disabled': True}]}
+                }
+            },
+        },
+    ),
+    'a-advanced': (
+        'api',
+        {
+            'type': 'A',
+            'ttl': 300,
+            'values': ['192.0.2.2', '192.0.2.1'],
+            'octodns': {
+                'bunnydns': {
+                    'smart_routing': 'latency',
+                    'advanced': {
+                        '192.0.2.2': [{'latency_zone': 'DE', 'weight': 50}],
+                        '192.0.2.1': [{'latency_zone': 'US', 'weight': 50}],
+                    },
+                }
+            },
+        },
+    ),
+    'mx': (
+        '',
+        {
+            'type': 'MX',
+            'ttl': 300,
+            'value': {'preference': 10, 'exchange': 'mx.example.net.'},
+        },
+    ),
+    'txt': (
+        'txt',
+        {'type': 'TXT', 'ttl': 300, 'value': 'v=spf1 -all; comment'},
+    ),
+}
+
+
+def desired_zone(key, normalizer):
+    zone = Zone('example.com.', [])
+    name, data = RECORDS[key]
+    zone.add_record(Record.new(zone, name, data, lenient=True), lenient=True)
+    return normalizer.process_source_zone(zone)
+
+
+@pytest.mark.parametrize('key', sorted(RECORDS))
+def test_round_trip_plans_nothing(bunny_api, make_provider, key):
+    bunny_api.add_zone('example.com')
+    normalizer = BunnyDNSNormalizer('normalize')
+    provider = make_provider()
+    plan = provider.plan(desired_zone(key, normalizer), processors=[normalizer])
+    assert len(plan.changes) == 1
+    provider.apply(plan)
+
+    provider = make_provider()
+    plan = provider.plan(desired_zone(key, normalizer), processors=[normalizer])
+    assert plan is None
+
+
+def test_advanced_keys_get_a_trailing_dot():
+    normalizer = BunnyDNSNormalizer('normalize')
+    data = {
+        'type': 'CNAME',
+        'value': 'origin.example.net',
+        'octodns': {
+            'bunnydns': {
+                'advanced': {
+                    'origin.example.net': [{'weight': 2}],
+                    'origin.example.net.': [{'weight': 1}],
+                }
+            }
+        },
+    }
+    assert normalizer._normalize_data('CNAME', data)
+    assert data['value'] == 'origin.example.net.'
+    assert data['octodns']['bunnydns']['advanced'] == {
+        'origin.example.net.': [{'weight': 1}, {'weight': 2}]
+    }
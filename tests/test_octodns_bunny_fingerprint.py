@@ -0,0 +1,144 @@
+"""Comparing the bunnydns settings of the existing and desired records."""
+
+from copy import deepcopy
+
+import pytest
+
+from octodns.record import Record
+from octodns.zone import Zone
+
+
+@pytest.fixture
+def provider(make_provider):
+    return make_provider()
+
+
+def test_order_independent(provider):
+    first = {
+        'smart_routing': 'latency',
+        'advanced': {
+            '192.0.2.1': [{'weight': 10}, {'weight': 20, 'disabled': True}],
+            '192.0.2.2': [{'latency_zone': 'DE'}],
+        },
+    }
+    second = {
+        'advanced': {
+            '192.0.2.2': [{'latency_zone': 'DE'}],
+            '192.0.2.1': [{'disabled': True, 'weight': 20}, {'weight': 10}],
+        },
+        'smart_routing': 'latency',
+    }
+    assert provider._bunnydns_fingerprint(
+        first
+    ) == provider._bunnydns_fingerprint(second)
+
+
+@pytest.mark.parametrize(
+    'smart_routing, entry',
+    [
+        ('none', {}),
+        ('none', {'disabled': False}),
+        # Only used with smart routing
+        ('none', {'weight': 10, 'monitor': 'ping', 'latency_zone': 'DE'}),
+        ('latency', {'weight': 100, 'monitor': 'none', 'latency_zone': ''}),
+        # Coordinates are only used by geo routing
+        ('latency', {'latitude': 1.5}),
+        ('geo', {'latitude': 0, 'longitude': 0, 'latency_zone': 'DE'}),
+    ],
+)
+def test_default_entries_match_missing_ones(provider, smart_routing, entry):
+    missing = {'smart_routing': smart_routing}
+    default = {
+        'smart_routing': smart_routing,
+        'advanced': {'192.0.2.1': [entry]},
+    }
+    assert provider._bunnydns_fingerprint(
+        default
+    ) == provider._bunnydns_fingerprint(missing)
+
+
+@pytest.mark.parametrize(
+    'smart_routing, entry',
+    [
+        ('none', {'disabled': True}),
+        ('latency', {'weight': 10}),
+        ('latency', {'monitor': 'http'}),
+        ('latency', {'latency_zone': 'DE'}),
+        ('geo', {'latitude': 1.5}),
+    ],
+)
+def test_other_entries_differ(provider, smart_routing, entry):
+    missing = {'smart_routing': smart_routing}
+    other = {'smart_routing': smart_routing, 'advanced': {'192.0.2.1': [entry]}}
+    assert provider._bunnydns_fingerprint(
+        other
+    ) != provider._bunnydns_fingerprint(missing)
+
+
+@pytest.mark.parametrize('smart_routing', ['latency', 'geo'])
+def test_weight_zero_is_the_default_under_smart_routing(
+    provider, smart_routing
+):
+    def bunnydns(weight):
+        return {
+            'smart_routing': smart_routing,
+            'advanced': {'192.0.2.1': [{'weight': weight, 'disabled': True}]},
+        }
+
+    assert provider._bunnydns_fingerprint(
+        bunnydns(0)
+    ) == provider._bunnydns_fingerprint(bunnydns(100))
+    assert provider._bunnydns_fingerprint(
+        bunnydns(0)
+    ) != provider._bunnydns_fingerprint(bunnydns(50))
+
+
+def zone_with(bunnydns):
+    zone = Zone('example.com.', [])
+    zone.add_record(
+        Record.new(
+            zone,
+            'www',
+            {
+                'type': 'A',
+                'ttl': 300,
+                'values': ['192.0.2.1', '192.0.2.2'],
+                'octodns': {'bunnydns': bunnydns},
+            },
+        )
+    )
+    return zone
+
+
+def test_extra_changes(provider):
+    existing = zone_with(
+        {
+            'smart_routing': 'latency',
+            'advanced': {
+                '192.0.2.1': [{'weight': 0, 'monitor': 'none'}],
+                '192.0.2.2': [{'weight': 10}],
+            },
+        }
+    )
+    desired = zone_with(
+        {
+            'advanced': {'192.0.2.2': [{'weight': 10}]},
+            'smart_routing': 'latency',
+        }
+    )
+    data = deepcopy([record.data for record in desired.records])
+    octodns = deepcopy([record.octodns for record in desired.records])
+    assert provider._extra_changes(existing, desired, []) == []
+    assert [record.data for record in desired.records] == data
+    assert [record.octodns for record in desired.records] == octodns
+
+    desired = zone_with(
+        {
+            'advanced': {'192.0.2.2': [{'weight': 20}]},
+            'smart_routing': 'latency',
+        }
+    )
+    octodns = deepcopy([record.octodns for record in desired.records])
+    changes = provider._extra_changes(existing, desired, [])
+    assert [change.new for change in changes] == list(desired.records)
+    assert [record.octodns for record in desired.records] == octodns
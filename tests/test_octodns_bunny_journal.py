@@ -0,0 +1,157 @@
+"""Resuming applies from the change journal."""
+
+import logging
+import os
+
+import pytest
+import requests_mock
+
+from octodns.record import Record
+from octodns.zone import Zone
+
+from octodns_bunny.client_exceptions import BunnyDNSClientAPIException500
+
+
+def desired_zone(count=4):
+    zone = Zone('example.com.', [])
+    for i in range(count):
+        zone.add_record(
+            Record.new(
+                zone,
+                f'host{i}',
+                {'type': 'A', 'ttl': 300, 'value': f'192.0.2.{i}'},
+            )
+        )
+    return zone
+
+
+def fail_put(number):
+    """A hook failing the `number`th record create, once."""
+    state = {'puts': 0}
+
+    def hook(request, path):
+        if request.method == 'PUT':
+            state['puts'] += 1
+            if state['puts'] == number:
+                return requests_mock.create_response(
+                    request, status_code=500, text='boom'
+                )
+        return None
+
+    return hook
+
+
+def names(bunny_api):
+    return sorted(r['Name'] for r in bunny_api.records('example.com'))
+
+
+def test_same_plan_resumes(bunny_api, make_provider, tmp_path):
+    bunny_api.add_zone('example.com')
+    provider = make_provider(journal_dir=str(tmp_path))
+    plan = provider.plan(desired_zone())
+    bunny_api.hooks.append(fail_put(3))
+    with pytest.raises(BunnyDNSClientAPIException500):
+        provider.apply(plan)
+    assert names(bunny_api) == ['host0', 'host1']
+    assert os.listdir(tmp_path) == ['example.com.journal']
+
+    # Applying the very same plan again skips the confirmed creates
+    provider.apply(plan)
+    assert names(bunny_api) == ['host0', 'host1', 'host2', 'host3']
+    assert os.listdir(tmp_path) == []
+    assert provider.plan(desired_zone()) is None
+
+
+def test_rolled_back_zone_is_fully_applied(bunny_api, make_provider, tmp_path):
+    bunny_api.add_zone('example.com')
+    provider = make_provider(journal_dir=str(tmp_path))
+    plan = provider.plan(desired_zone())
+    bunny_api.hooks.append(fail_put(3))
+    with pytest.raises(BunnyDNSClientAPIException500):
+        provider.apply(plan)
+
+    # Somebody rolls the zone back, the journaled creates are gone
+    bunny_api.zones['example.com']['Records'] = []
+    provider.apply(plan)
+    assert names(bunny_api) == ['host0', 'host1', 'host2', 'host3']
+    assert provider.plan(desired_zone()) is None
+
+
+def test_next_run_resumes(bunny_api, make_provider, tmp_path, caplog):
+    bunny_api.add_zone('example.com')
+    provider = make_provider(journal_dir=str(tmp_path))
+    bunny_api.hooks.append(fail_put(3))
+    with pytest.raises(BunnyDNSClientAPIException500):
+        provider.apply(provider.plan(desired_zone()))
+
+    # Another process plans the same desired state, only the missing records
+    # are left to create
+    provider = make_provider(journal_dir=str(tmp_path))
+    plan = provider.plan(desired_zone())
+    assert len(plan.changes) == 2
+    with caplog.at_level(logging.INFO):
+        provider.apply(plan)
+    assert 'resuming, 2 of 2 journaled creates confirmed' in caplog.text
+    assert names(bunny_api) == ['host0', 'host1', 'host2', 'host3']
+    assert len(bunny_api.requests('PUT')) == 5
+    assert os.listdir(tmp_path) == []
+
+
+def test_other_desired_state_starts_a_new_journal(
+    bunny_api, make_provider, tmp_path, caplog
+):
+    bunny_api.add_zone('example.com')
+    provider = make_provider(journal_dir=str(tmp_path))
+    bunny_api.hooks.append(fail_put(3))
+    with pytest.raises(BunnyDNSClientAPIException500):
+        provider.apply(provider.plan(desired_zone()))
+
+    with caplog.at_level(logging.INFO):
+        provider.apply(provider.plan(desired_zone(count=5)))
+    assert 'resuming' not in caplog.text
+    assert names(bunny_api) == ['host0', 'host1', 'host2', 'host3', 'host4']
+    assert os.listdir(tmp_path) == []
+
+
+def updated_zone():
+    zone = Zone('example.com.', [])
+    for name, values in (
+        ('host0', ['192.0.2.10', '192.0.2.11']),
+        ('host1', ['192.0.2.20']),
+    ):
+        zone.add_record(
+            Record.new(zone, name, {'type': 'A', 'ttl': 300, 'values': values})
+        )
+    return zone
+
+
+@pytest.mark.parametrize('next_run', [False, True])
+def test_resumed_update_keeps_the_created_records(
+    bunny_api, make_provider, tmp_path, next_run
+):
+    bunny_api.add_zone('example.com')
+    bunny_api.add_record('example.com', Type='A', Name='host0', Value='1.1.1.1')
+    bunny_api.add_record('example.com', Type='A', Name='host1', Value='2.2.2.2')
+    provider = make_provider(journal_dir=str(tmp_path))
+    plan = provider.plan(updated_zone())
+    assert len(plan.changes) == 2
+    # host0 is deleted and gets its 1st value, its 2nd one fails
+    bunny_api.hooks.append(fail_put(2))
+    with pytest.raises(BunnyDNSClientAPIException500):
+        provider.apply(plan)
+    assert [
+        (r['Name'], r['Value']) for r in bunny_api.records('example.com')
+    ] == [('host1', '2.2.2.2'), ('host0', '192.0.2.10')]
+
+    if next_run:
+        provider = make_provider(journal_dir=str(tmp_path))
+        plan = provider.plan(updated_zone())
+    provider.apply(plan)
+    assert sorted(
+        (r['Name'], r['Value']) for r in bunny_api.records('example.com')
+    ) == [
+        ('host0', '192.0.2.10'),
+        ('host0', '192.0.2.11'),
+        ('host1', '192.0.2.20'),
+    ]
+    assert provider.plan(updated_zone()) is None
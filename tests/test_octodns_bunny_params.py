@@ -0,0 +1,136 @@
+"""Building the request bodies of the records with advanced settings."""
+
+from copy import deepcopy
+
+import pytest
+
+from octodns.record import Record
+from octodns.zone import Zone
+
+
+def body(value, _type='A', **fields):
+    base = {
+        'Value': value,
+        'Name': 'www',
+        'Ttl': 300,
+        'Type': _type,
+        'Disabled': False,
+        'SmartRoutingType': 0,
+        'Weight': 0,
+        'MonitorType': 0,
+        'LatencyZone': '',
+        'GeolocationLatitude': 0,
+        'GeolocationLongitude': 0,
+    }
+    if _type in ('A', 'CNAME'):
+        base['Accelerated'] = False
+    base.update(fields)
+    return base
+
+
+def new_record(_type, values, bunnydns):
+    zone = Zone('example.com.', [])
+    data = {'type': _type, 'ttl': 300, 'octodns': {'bunnydns': bunnydns}}
+    if _type == 'CNAME':
+        data['value'] = values[0]
+    else:
+        data['values'] = values
+    return Record.new(zone, 'www', data)
+
+
+def test_repeated_values_get_their_entries_in_order(make_provider):
+    provider = make_provider()
+    record = new_record(
+        'A',
+        ['192.0.2.1', '192.0.2.1', '192.0.2.1', '192.0.2.2'],
+        {
+            'smart_routing': 'latency',
+            'accelerated': True,
+            'advanced': {
+                '192.0.2.1': [
+                    {'weight': 10, 'latency_zone': 'DE'},
+                    {'weight': 20, 'disabled': True, 'monitor': 'ping'},
+                ],
+                '192.0.2.2': [
+                    {'latitude': 1.5, 'longitude': 2.5, 'monitor': 'bogus'}
+                ],
+            },
+        },
+    )
+    octodns = deepcopy(record.octodns)
+    routed = {'SmartRoutingType': 1, 'Accelerated': True}
+    expected = [
+        body('192.0.2.1', Weight=10, LatencyZone='DE', **routed),
+        body('192.0.2.1', Weight=20, Disabled=True, MonitorType=1, **routed),
+        # More values than entries, the rest get the defaults
+        body('192.0.2.1', Weight=100, **routed),
+        body(
+            '192.0.2.2',
+            Weight=100,
+            GeolocationLatitude=1.5,
+            GeolocationLongitude=2.5,
+            **routed,
+        ),
+    ]
+    assert provider._bodies_for(record) == expected
+    # The record isn't consumed, building again gives the same bodies
+    assert provider._bodies_for(record) == expected
+    assert record.octodns == octodns
+
+
+@pytest.mark.parametrize(
+    '_type, values, bunnydns, expected',
+    [
+        ('AAAA', ['2001:db8::1'], {}, [body('2001:db8::1', _type='AAAA')]),
+        (
+            'AAAA',
+            ['2001:db8::1'],
+            {
+                'accelerated': True,
+                'advanced': {'2001:db8::1': [{'monitor': 'http'}]},
+            },
+            # No Accelerated on AAAA
+            [body('2001:db8::1', _type='AAAA', MonitorType=2)],
+        ),
+        (
+            'CNAME',
+            ['cdn.example.net.'],
+            {
+                'smart_routing': 'geo',
+                'advanced': {'cdn.example.net.': [{'weight': 5}]},
+            },
+            [
+                body(
+                    'cdn.example.net.',
+                    _type='CNAME',
+                    SmartRoutingType=2,
+                    Weight=5,
+                )
+            ],
+        ),
+        (
+            'A',
+            ['192.0.2.1'],
+            # Unusable advanced settings are ignored
+            {'advanced': ['192.0.2.1']},
+            [body('192.0.2.1')],
+        ),
+    ],
+)
+def test_bodies(make_provider, _type, values, bunnydns, expected):
+    provider = make_provider()
+    record = new_record(_type, values, bunnydns)
+    octodns = deepcopy(record.octodns)
+    for _ in range(2):
+        assert provider._bodies_for(record) == expected
+    assert record.octodns == octodns
+
+
+@pytest.mark.parametrize(
+    'smart_routing, weight', [('none', 0), ('latency', 100), ('geo', 100)]
+)
+def test_default_weight(make_provider, smart_routing, weight):
+    provider = make_provider()
+    record = new_record('A', ['192.0.2.1'], {'smart_routing': smart_routing})
+    assert provider.get_weight_default_by_smart_routing(record) == weight
+    assert provider._bodies_for(record)[0]['Weight'] == weight
@@ -0,0 +1,26 @@
+"""Populating zones from BunnyDNS."""
+
+import logging
+
+from octodns.zone import Zone
+
+
+def test_trusted_populate_warns_about_invalid_records(
+    bunny_api, make_provider, caplog
+):
+    bunny_api.add_zone('example.com')
+    bunny_api.add_record(
+        'example.com', Type='A', Name='www', Value='192.0.2.1', Ttl=-5
+    )
+    bunny_api.add_record(
+        'example.com', Type='A', Name='ok', Value='192.0.2.2', Ttl=300
+    )
+    provider = make_provider(trusted_populate=True)
+    zone = Zone('example.com.', [])
+    with caplog.at_level(logging.WARNING):
+        provider.populate(zone, target=True)
+    assert sorted(r.name for r in zone.records) == ['ok', 'www']
+    warnings = [r.getMessage() for r in caplog.records]
+    assert len(warnings) == 1
+    assert 'www.example.com.' in warnings[0]
+    assert 'invalid ttl' in warnings[0]
@@ -0,0 +1,90 @@
+"""The custom BunnyDNS record types and their values."""
+
+import pickle
+
+import pytest
+
+from octodns.record import Record
+from octodns.zone import Zone
+
+from octodns_bunny.record import (
+    _BunnyDNSPullZoneValue,
+    _BunnyDNSRedirectValue,
+    _BunnyDNSScriptValue,
+)
+
+VALUE_TYPES = [
+    _BunnyDNSPullZoneValue,
+    _BunnyDNSRedirectValue,
+    _BunnyDNSScriptValue,
+]
+
+
+@pytest.mark.parametrize('value_type', VALUE_TYPES)
+def test_values_compare_and_hash_within_a_type(value_type):
+    value = value_type(123)
+    assert value == value_type(123)
+    assert hash(value) == hash(value_type(123))
+    assert value_type(value) == value
+    assert value != value_type(124)
+    assert value < value_type(124)
+    assert len({value, value_type(123), value_type(124)}) == 2
+    # Not a tuple or the raw value
+    assert value != 123
+    assert value
+
+
+def test_values_differ_across_types():
+    values = [value_type(123) for value_type in VALUE_TYPES]
+    assert len(set(values)) == 3
+    for value in values:
+        assert [other for other in values if other == value] == [value]
+    assert sorted(values, reverse=True) == sorted(values)[::-1]
+
+
+@pytest.mark.parametrize('value_type', VALUE_TYPES)
+def test_values_are_immutable(value_type):
+    value = value_type(123)
+    with pytest.raises(AttributeError):
+        value.value = 124
+    with pytest.raises(AttributeError):
+        del value.value
+    assert value.value == 123
+
+
+@pytest.mark.parametrize('value_type', VALUE_TYPES)
+def test_values_pickle(value_type):
+    value = value_type(123)
+    unpickled = pickle.loads(pickle.dumps(value))
+    assert type(unpickled) is value_type
+    assert unpickled == value
+    assert hash(unpickled) == hash(value)
+
+
+@pytest.mark.parametrize('_type', ['PULLZONE', 'REDIRECT', 'SCRIPT'])
+def test_record_data_and_copy(_type):
+    zone = Zone('example.com.', [])
+    record = Record.new(
+        zone,
+        'cdn',
+        {'type': f'BunnyDNSProvider/{_type}', 'ttl': 300, 'values': [123]},
+    )
+    assert record.values[0].data == 123
+    assert repr(record.values[0]) == '123'
+    assert record.data == {'ttl': 300, 'value': 123}
+
+    copy = record.copy()
+    assert copy is not record
+    assert copy.values == record.values
+    assert copy.data == record.data
+    assert not record.changes(copy, zone)
+
+    other = Record.new(
+        zone,
+        'cdn',
+        {'type': f'BunnyDNSProvider/{_type}', 'ttl': 300, 'values': [124]},
+    )
+    assert record.changes(other, zone)
+
+    unpickled = pickle.loads(pickle.dumps(record))
+    assert unpickled.values == record.values
@@ -0,0 +1,59 @@
+"""Mapping the BunnyDNS API responses."""
+
+import pytest
+import requests_mock
+
+from octodns.record import Record
+from octodns.zone import Zone
+
+from octodns_bunny.client_exceptions import (
+    BunnyDNSClientAPIException429,
+    BunnyDNSClientAPIExceptionServerError,
+    BunnyDNSClientAPIExceptionUnexpectedStatus,
+)
+
+
+def desired_zone():
+    zone = Zone('example.com.', [])
+    zone.add_record(
+        Record.new(zone, 'www', {'type': 'A', 'ttl': 300, 'value': '192.0.2.1'})
+    )
+    return zone
+
+
+def put_status(status_code):
+    def hook(request, path):
+        if request.method == 'PUT':
+            return requests_mock.create_response(
+                request, status_code=status_code, json={'Message': 'nope'}
+            )
+        return None
+
+    return hook
+
+
+@pytest.mark.parametrize(
+    'status_code, exception',
+    [
+        (429, BunnyDNSClientAPIException429),
+        (502, BunnyDNSClientAPIExceptionServerError),
+        (503, BunnyDNSClientAPIExceptionServerError),
+        (409, BunnyDNSClientAPIExceptionUnexpectedStatus),
+    ],
+)
+def test_failed_creates_raise(
+    bunny_api, make_provider, tmp_path, status_code, exception
+):
+    bunny_api.add_zone('example.com')
+    provider = make_provider(journal_dir=str(tmp_path))
+    bunny_api.hooks.append(put_status(status_code))
+    with pytest.raises(exception):
+        provider.apply(provider.plan(desired_zone()))
+    assert bunny_api.records('example.com') == []
+    # Nothing was journaled as created
+    journal = (tmp_path / 'example.com.journal').read_text().splitlines()
+    assert len(journal) == 1
+
+    bunny_api.hooks.clear()
+    provider.apply(provider.plan(desired_zone()))
+    assert [r['Name'] for r in bunny_api.records('example.com')] == ['www']
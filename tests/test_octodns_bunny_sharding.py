@@ -0,0 +1,58 @@
+"""Splitting the zones across sync nodes."""
+
+import random
+
+import pytest
+
+from octodns_bunny.sharding import (
+    LOAD_SLACK,
+    assign_shards,
+    hash_shard,
+    zone_weight,
+)
+
+
+def listing(counts):
+    return [
+        {'Domain': f'zone{i}.com', 'Records': [{}] * count}
+        for i, count in enumerate(counts)
+    ]
+
+
+@pytest.fixture
+def counts():
+    rng = random.Random(42)
+    return [int(rng.paretovariate(1.2) * 10) for _ in range(500)]
+
+
+@pytest.mark.parametrize('shard_count', [2, 4, 8])
+def test_shards_are_balanced(counts, shard_count):
+    zones = listing(counts)
+    assignment = assign_shards(zones, shard_count)
+    loads = [0] * shard_count
+    for zone in zones:
+        loads[assignment[zone['Domain']]] += zone_weight(zone)
+    # A zone heavier than the even share fills its shard on its own
+    heaviest = max(zone_weight(zone) for zone in zones)
+    assert max(loads) <= max(LOAD_SLACK * sum(loads) / shard_count, heaviest)
+
+
+@pytest.mark.parametrize('shard_count', [2, 4, 8])
+def test_record_churn_moves_few_zones(counts, shard_count):
+    before = assign_shards(listing(counts), shard_count)
+    rng = random.Random(7)
+    churned = [int(count * rng.uniform(0.9, 1.1)) for count in counts]
+    after = assign_shards(listing(churned), shard_count)
+    assert sum(before[d] != after[d] for d in before) <= len(counts) // 100
+
+
+@pytest.mark.parametrize('shard_count', [2, 4, 8])
+def test_new_zone_moves_few_zones(counts, shard_count):
+    before = assign_shards(listing(counts), shard_count)
+    after = assign_shards(listing(counts + [50]), shard_count)
+    assert sum(before[d] != after[d] for d in before) <= len(counts) // 100
+
+
+def test_unlisted_zones_are_hashed():
+    assert hash_shard('example.com.', 4) == hash_shard('example.com', 4)
+    assert {hash_shard(f'zone{i}.com', 4) for i in range(100)} == {0, 1, 2, 3}
@@ -0,0 +1,83 @@
+"""Skipping the zones unchanged since they were last found in sync."""
+
+import pytest
+
+from octodns.record import Record
+from octodns.zone import Zone
+
+
+def desired_zone(**bunnydns):
+    zone = Zone('example.com.', [])
+    data = {'type': 'A', 'ttl': 300, 'value': '192.0.2.1'}
+    if bunnydns:
+        data['octodns'] = {'bunnydns': bunnydns}
+    zone.add_record(Record.new(zone, 'www', data))
+    return zone
+
+
+@pytest.fixture
+def planner(bunny_api, make_provider, tmp_path):
+    bunny_api.add_zone('example.com')
+    bunny_api.add_record('example.com', Type='A', Name='www', Value='192.0.2.1')
+    state_file = str(tmp_path / 'zones.json')
+
+    def plan(desired):
+        """Plan with a fresh provider, return the plan and the populates."""
+        provider = make_provider(
+            skip_unchanged_zones=True, zone_state_file=state_file
+        )
+        populates = []
+        populate = provider.populate
+
+        def counting_populate(zone, *args, **kwargs):
+            populates.append(zone.name)
+            return populate(zone, *args, **kwargs)
+
+        provider.populate = counting_populate
+        return provider, provider.plan(desired), populates
+
+    return plan
+
+
+def test_in_sync_zone_is_skipped(planner):
+    _, plan, populates = planner(desired_zone())
+    assert plan is None
+    assert populates == ['example.com.']
+
+    for _ in range(2):
+        _, plan, populates = planner(desired_zone())
+        assert plan is None
+        assert populates == []
+
+
+def test_bunnydns_edit_is_planned(planner):
+    _, plan, _ = planner(desired_zone())
+    assert plan is None
+
+    _, plan, populates = planner(desired_zone(accelerated=True))
+    assert populates == ['example.com.']
+    assert plan is not None
+    assert [c.new.octodns for c in plan.changes] == [
+        {'bunnydns': {'accelerated': True}}
+    ]
+
+
+def test_applied_zone_is_planned_again(bunny_api, planner):
+    _, plan, _ = planner(desired_zone())
+    assert plan is None
+
+    desired = desired_zone(accelerated=True)
+    provider, plan, _ = planner(desired)
+    provider.apply(plan)
+    assert [r['Accelerated'] for r in bunny_api.records('example.com')] == [
+        True
+    ]
+
+    # The content of the applied zone isn't known until it's downloaded
+    _, plan, populates = planner(desired_zone(accelerated=True))
+    assert plan is None
+    assert populates == ['example.com.']
+
+    _, plan, populates = planner(desired_zone(accelerated=True))
+    assert plan is None
+    assert populates == []
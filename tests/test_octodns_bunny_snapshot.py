@@ -0,0 +1,111 @@
+"""Planning the zones from their snapshots."""
+
+import json
+import time
+
+import pytest
+
+from octodns.record import Record
+from octodns.zone import Zone
+
+from octodns_bunny.provider import BunnyDNSProviderException
+from octodns_bunny.snapshot import write_snapshot
+
+
+def desired_zone():
+    zone = Zone('example.com.', [])
+    for name, value in (('www', '192.0.2.1'), ('api', '192.0.2.2')):
+        zone.add_record(
+            Record.new(zone, name, {'type': 'A', 'ttl': 300, 'value': value})
+        )
+    return zone
+
+
+@pytest.fixture
+def snapshot(bunny_api, make_provider, tmp_path):
+    bunny_api.add_zone('example.com')
+    bunny_api.add_record('example.com', Type='A', Name='www', Value='192.0.2.1')
+
+    def take(age=0):
+        """Snapshot the zone as it is now, `age` seconds ago."""
+        client = make_provider()._client
+        path = write_snapshot(
+            str(tmp_path),
+            'example.com',
+            client.lookup_domain_records('example.com'),
+            date_modified=client.zone_modified('example.com'),
+        )
+        with open(path, encoding='utf-8') as fh:
+            data = json.load(fh)
+        data['Fetched'] = time.time() - age
+        with open(path, 'w', encoding='utf-8') as fh:
+            json.dump(data, fh)
+        bunny_api.calls.clear()
+        return path
+
+    return take
+
+
+def names(bunny_api):
+    return sorted(r['Name'] for r in bunny_api.records('example.com'))
+
+
+def test_plan_makes_no_calls(bunny_api, make_provider, snapshot, tmp_path):
+    snapshot()
+    provider = make_provider(snapshot_dir=str(tmp_path))
+    plan = provider.plan(desired_zone())
+    assert bunny_api.calls == []
+    assert [c.new.name for c in plan.changes] == ['api']
+
+
+def test_missing_snapshot_is_fetched(bunny_api, make_provider, tmp_path):
+    bunny_api.add_zone('example.com')
+    provider = make_provider(snapshot_dir=str(tmp_path))
+    assert not (tmp_path / 'example.com.snapshot.json').exists()
+    plan = provider.plan(desired_zone())
+    assert len(plan.changes) == 2
+    assert bunny_api.calls
+
+
+def test_fresh_snapshot_is_applied(
+    bunny_api, make_provider, snapshot, tmp_path
+):
+    snapshot(age=10)
+    provider = make_provider(snapshot_dir=str(tmp_path), snapshot_max_age=60)
+    plan = provider.plan(desired_zone())
+    # The snapshot isn't checked against the zone
+    bunny_api.add_record(
+        'example.com', Type='A', Name='extra', Value='192.0.2.9'
+    )
+    provider.apply(plan)
+    assert names(bunny_api) == ['api', 'extra', 'www']
+
+
+def test_stale_unchanged_snapshot_is_applied(
+    bunny_api, make_provider, snapshot, tmp_path
+):
+    snapshot(age=3600)
+    provider = make_provider(snapshot_dir=str(tmp_path), snapshot_max_age=60)
+    plan = provider.plan(desired_zone())
+    assert bunny_api.calls == []
+    provider.apply(plan)
+    assert names(bunny_api) == ['api', 'www']
+
+
+def test_stale_changed_snapshot_is_refused(
+    bunny_api, make_provider, snapshot, tmp_path
+):
+    snapshot(age=3600)
+    provider = make_provider(snapshot_dir=str(tmp_path), snapshot_max_age=60)
+    plan = provider.plan(desired_zone())
+    bunny_api.add_record(
+        'example.com', Type='A', Name='extra', Value='192.0.2.9'
+    )
+    with pytest.raises(BunnyDNSProviderException, match='changed since'):
+        provider.apply(plan)
+    assert names(bunny_api) == ['extra', 'www']
+
+    # Planned again from the live zone
+    plan = provider.plan(desired_zone())
+    provider.apply(plan)
+    assert names(bunny_api) == ['api', 'www']